@@ -1,16 +1,69 @@
 import logging
+import os
+import re
 from pathlib import Path
-from typing import Iterator, List, Optional
+from typing import Callable, Dict, Iterator, List, Optional, Pattern, Tuple
 
 import alchy
 import sqlalchemy as sqa
+from sqlalchemy.orm import joinedload
 from cg.apps.cgstats.crud import find
 from cg.apps.cgstats.db import models
+from cg.constants.cgstats import Q30_THRESHOLDS
 from cg.models.cgstats.flowcell import StatsFlowcell, StatsSample
+from cg.utils.files import get_dir_entries
 
 LOG = logging.getLogger(__name__)
 
 
+def _scan_dirs(directory: str, match: Callable[[str], bool]) -> List[str]:
+    """Return the paths of the sub directories whose names match"""
+    return [
+        entry.path for entry in get_dir_entries(directory) if match(entry.name) and entry.is_dir()
+    ]
+
+
+def _scan_sub_dirs(directories: List[str], match: Callable[[str], bool]) -> List[str]:
+    """Return the matching sub directories of each directory"""
+    return [path for directory in directories for path in _scan_dirs(directory, match)]
+
+
+def _get_sample_dirs(root_dir: Path, flowcell: str) -> Dict[str, List[str]]:
+    """Map the sample directories of the demultiplexed runs of a flowcell by name
+
+    Walks *{flowcell}/Unaligned*/Project_*/Sample_* and strips the Sample_ prefix from the keys
+    """
+    sample_dirs: Dict[str, List[str]] = {}
+    flowcell_dirs: List[str] = _scan_dirs(str(root_dir), lambda name: name.endswith(flowcell))
+    if not flowcell_dirs:
+        LOG.debug("No demultiplexed runs found for flowcell %s in %s", flowcell, root_dir)
+        return sample_dirs
+    unaligned_dirs: List[str] = _scan_sub_dirs(
+        flowcell_dirs, lambda name: name.startswith("Unaligned")
+    )
+    project_dirs: List[str] = _scan_sub_dirs(
+        unaligned_dirs, lambda name: name.startswith("Project_")
+    )
+    for sample_dir in _scan_sub_dirs(project_dirs, lambda name: name.startswith("Sample_")):
+        sample_dir_name: str = os.path.basename(sample_dir)[len("Sample_") :]
+        sample_dirs.setdefault(sample_dir_name, []).append(sample_dir)
+    return sample_dirs
+
+
+def _iter_fastqs(sample_dirs: Dict[str, List[str]], sample_name: str) -> Iterator[Tuple[str, str]]:
+    """Yield the file name and path of the FASTQ files in the Sample_{sample_name} and
+    Sample_{sample_name}_* directories"""
+    sample_dir_pattern: Pattern = re.compile(rf"{re.escape(sample_name)}(?:_.*)?", re.DOTALL)
+    for sample_dir_name, sample_dir_paths in sample_dirs.items():
+        if not sample_dir_pattern.fullmatch(sample_dir_name):
+            continue
+        for sample_dir in sample_dir_paths:
+            with os.scandir(sample_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".fastq.gz"):
+                        yield entry.name, entry.path
+
+
 class StatsAPI(alchy.Manager):
 
     Project = models.Project
@@ -26,86 +79,131 @@ class StatsAPI(alchy.Manager):
         alchy_config = dict(SQLALCHEMY_DATABASE_URI=config["cgstats"]["database"])
         super(StatsAPI, self).__init__(config=alchy_config, Model=models.Model)
         self.root_dir = Path(config["cgstats"]["root"])
+        self._lane_sample_counts: Dict[int, Dict[int, int]] = {}
 
     @staticmethod
     def get_curated_sample_name(sample_name: str) -> str:
         """Create new sample name"""
-        raw_sample_name: str = sample_name.split("_", 1)[0]
+        raw_sample_name: str = sample_name.partition("_")[0]
         return raw_sample_name.rstrip("AB")
 
     def get_flowcell_samples(self, flowcell_object: models.Flowcell) -> List[StatsSample]:
         flowcell_samples: List[StatsSample] = []
-        for sample_obj in self.flowcell_samples(flowcell_obj=flowcell_object):
-            curated_sample_name: str = self.get_curated_sample_name(sample_obj.samplename)
-            sample_data = {"name": curated_sample_name, "reads": 0, "fastqs": []}
-            for fc_data in self.sample_reads(sample_obj):
-                if fc_data.type == "hiseqga" and fc_data.q30 >= 80:
-                    sample_data["reads"] += fc_data.reads
-                elif fc_data.type == "hiseqx" and fc_data.q30 >= 75:
-                    sample_data["reads"] += fc_data.reads
-                elif fc_data.type == "novaseq" and fc_data.q30 >= 75:
-                    sample_data["reads"] += fc_data.reads
-                else:
-                    LOG.warning(
-                        f"q30 too low for {curated_sample_name} on {fc_data.name}:"
-                        f"{fc_data.q30} < {80 if fc_data.type == 'hiseqga' else 75}%"
-                    )
+        lane_sample_counts: Dict[int, int] = self.lane_sample_counts(flowcell_obj=flowcell_object)
+        flowcell_sample_dirs: Dict[str, Dict[str, List[str]]] = {}
+        sample_reads: Dict[Tuple[int, str], list] = {}
+        for fc_data in self.flowcell_sample_reads(flowcell_obj=flowcell_object):
+            sample_reads.setdefault((fc_data.sample_id, fc_data.samplename), []).append(fc_data)
+        for (_, sample_name), sample_flowcell_reads in sample_reads.items():
+            curated_sample_name: str = self.get_curated_sample_name(sample_name)
+            reads: int = 0
+            fastqs: List[str] = []
+            for fc_data in sample_flowcell_reads:
+                if fc_data.reads is None:
+                    threshold: Optional[int] = Q30_THRESHOLDS.get(fc_data.type)
+                    if threshold is None:
+                        LOG.warning(f"unknown sequencer type {fc_data.type} for {fc_data.name}")
+                    else:
+                        LOG.warning(
+                            f"q30 too low for {curated_sample_name} on {fc_data.name}:"
+                            f"{fc_data.q30} < {threshold}%"
+                        )
                     continue
-                for fastq_path in self.fastqs(fc_data.name, sample_obj):
-                    if self.is_lane_pooled(
-                        flowcell_obj=flowcell_object, lane=fc_data.lane
-                    ) and "Undetermined" in str(fastq_path):
+                # SUM() of an integer column is returned as a Decimal by MySQL
+                reads += int(fc_data.reads)
+                lane_pooled: bool = lane_sample_counts.get(fc_data.lane, 0) > 1
+                if fc_data.name not in flowcell_sample_dirs:
+                    flowcell_sample_dirs[fc_data.name] = _get_sample_dirs(
+                        root_dir=self.root_dir, flowcell=fc_data.name
+                    )
+                for fastq_name, fastq_path in _iter_fastqs(
+                    sample_dirs=flowcell_sample_dirs[fc_data.name],
+                    sample_name=sample_name,
+                ):
+                    if lane_pooled and "Undetermined" in fastq_name:
                         continue
-                    sample_data["fastqs"].append(str(fastq_path))
-            flowcell_samples.append(StatsSample(**sample_data))
+                    fastqs.append(fastq_path)
+            flowcell_samples.append(
+                StatsSample(name=curated_sample_name, reads=reads, fastqs=fastqs)
+            )
         return flowcell_samples
 
     def flowcell(self, flowcell_name: str) -> StatsFlowcell:
         """Fetch information about a flowcell."""
-        flowcell_object: models.Flowcell = self.Flowcell.query.filter_by(
-            flowcellname=flowcell_name
-        ).first()
-        flowcell_data = {
-            "name": flowcell_object.flowcellname,
-            "sequencer": flowcell_object.demux[0].datasource.machine,
-            "sequencer_type": flowcell_object.hiseqtype,
-            "date": flowcell_object.time,
-            "samples": self.get_flowcell_samples(flowcell_object),
-        }
-
-        return StatsFlowcell(**flowcell_data)
-
-    def flowcell_samples(self, flowcell_obj: models.Flowcell) -> Iterator[models.Sample]:
-        """Fetch all the samples from a flowcell."""
-        return self.Sample.query.join(models.Sample.unaligned, models.Unaligned.demux).filter(
-            models.Demux.flowcell == flowcell_obj
+        flowcell_object: models.Flowcell = (
+            self.session.query(models.Flowcell)
+            .filter(models.Flowcell.flowcellname == flowcell_name)
+            .options(joinedload(models.Flowcell.demux).joinedload(models.Demux.datasource))
+            .first()
+        )
+        return StatsFlowcell(
+            name=flowcell_object.flowcellname,
+            sequencer=flowcell_object.demux[0].datasource.machine,
+            sequencer_type=flowcell_object.hiseqtype,
+            date=flowcell_object.time,
+            samples=self.get_flowcell_samples(flowcell_object),
         )
 
-    def is_lane_pooled(self, flowcell_obj: models.Flowcell, lane: str) -> bool:
-        """Check whether a lane is pooled or not."""
-        query = (
-            self.session.query(sqa.func.count(models.Unaligned.sample_id).label("sample_count"))
+    def flowcell_sample_reads(self, flowcell_obj: models.Flowcell) -> alchy.Query:
+        """Calculate the reads per flowcell for all samples on a flowcell.
+
+        Returns one row per sample and flowcell, so that the samples of a flowcell are fetched
+        together with their reads.
+
+        Reads are only counted from flowcells where the q30 of the sample passes the threshold of
+        the sequencer type, otherwise the reads are returned as NULL.
+        """
+        q30 = sqa.func.min(models.Unaligned.q30_bases_pct)
+        passed_q30 = sqa.or_(
+            *[
+                sqa.and_(models.Flowcell.hiseqtype == sequencer_type, q30 >= threshold)
+                for sequencer_type, threshold in Q30_THRESHOLDS.items()
+            ]
+        )
+        reads = sqa.func.coalesce(sqa.func.sum(models.Unaligned.readcounts), 0)
+        flowcell_sample_ids = (
+            self.session.query(models.Unaligned.sample_id)
             .join(models.Unaligned.demux)
             .filter(models.Demux.flowcell == flowcell_obj)
-            .filter(models.Unaligned.lane == lane)
         )
-        return query.first().sample_count > 1
-
-    def sample_reads(self, sample_obj: models.Sample) -> alchy.Query:
-        """Calculate reads for a sample."""
         return (
             self.session.query(
+                models.Sample.sample_id,
+                models.Sample.samplename,
                 models.Flowcell.flowcellname.label("name"),
                 models.Flowcell.hiseqtype.label("type"),
-                models.Unaligned.lane,
-                sqa.func.sum(models.Unaligned.readcounts).label("reads"),
-                sqa.func.min(models.Unaligned.q30_bases_pct).label("q30"),
+                sqa.func.min(models.Unaligned.lane).label("lane"),
+                sqa.case([(passed_q30, reads)], else_=None).label("reads"),
+                q30.label("q30"),
+            )
+            .join(models.Flowcell.demux, models.Demux.unaligned, models.Unaligned.sample)
+            .filter(models.Sample.sample_id.in_(flowcell_sample_ids.subquery()))
+            .group_by(
+                models.Sample.sample_id,
+                models.Sample.samplename,
+                models.Flowcell.flowcellname,
+                models.Flowcell.hiseqtype,
             )
-            .join(models.Flowcell.demux, models.Demux.unaligned)
-            .filter(models.Unaligned.sample == sample_obj)
-            .group_by(models.Flowcell.flowcellname)
         )
 
+    def lane_sample_counts(self, flowcell_obj: models.Flowcell) -> Dict[int, int]:
+        """Count the number of samples in each lane of a flowcell."""
+        if flowcell_obj.flowcell_id in self._lane_sample_counts:
+            return self._lane_sample_counts[flowcell_obj.flowcell_id]
+        query = (
+            self.session.query(models.Unaligned.lane, sqa.func.count(models.Unaligned.sample_id))
+            .join(models.Unaligned.demux)
+            .filter(models.Demux.flowcell == flowcell_obj)
+            .group_by(models.Unaligned.lane)
+        )
+        lane_sample_counts: Dict[int, int] = dict(query.all())
+        self._lane_sample_counts[flowcell_obj.flowcell_id] = lane_sample_counts
+        return lane_sample_counts
+
+    def is_lane_pooled(self, flowcell_obj: models.Flowcell, lane: str) -> bool:
+        """Check whether a lane is pooled or not."""
+        return self.lane_sample_counts(flowcell_obj=flowcell_obj).get(lane, 0) > 1
+
     @staticmethod
     def sample(sample_name: str) -> models.Sample:
         """Fetch a sample for the database by name."""
@@ -113,12 +211,41 @@ class StatsAPI(alchy.Manager):
 
     def fastqs(self, flowcell: str, sample_obj: models.Sample) -> Iterator[Path]:
         """Fetch FASTQ files for a sample."""
-        base_pattern = "*{}/Unaligned*/Project_*/Sample_{}/*.fastq.gz"
-        alt_pattern = "*{}/Unaligned*/Project_*/Sample_{}_*/*.fastq.gz"
-        for fastq_pattern in (base_pattern, alt_pattern):
-            pattern = fastq_pattern.format(flowcell, sample_obj.samplename)
-            files = self.root_dir.glob(pattern)
-            yield from files
+        for _, fastq_path in _iter_fastqs(
+            sample_dirs=_get_sample_dirs(root_dir=self.root_dir, flowcell=flowcell),
+            sample_name=sample_obj.samplename,
+        ):
+            yield Path(fastq_path)
+
+    def flowcell_meta(self, flowcell_name: str) -> Tuple[str, str]:
+        """Get the latest document path and run name of a flowcell in one query
+
+        Raises NoResultFound if the flowcell does not exist
+        """
+        document_path = (
+            self.session.query(models.Supportparams.document_path)
+            .join(models.Flowcell.demux, models.Demux.datasource, models.Datasource.supportparams)
+            .filter(models.Flowcell.flowcellname == flowcell_name)
+            .order_by(models.Supportparams.supportparams_id.desc())
+            .limit(1)
+            .correlate(None)
+            .as_scalar()
+        )
+        run_name = (
+            self.session.query(models.Datasource.runname)
+            .join(models.Flowcell.demux, models.Demux.datasource)
+            .filter(models.Flowcell.flowcellname == flowcell_name)
+            .order_by(models.Datasource.time.desc())
+            .limit(1)
+            .correlate(None)
+            .as_scalar()
+        )
+        query = (
+            self.session.query(document_path.label("document_path"), run_name.label("runname"))
+            .filter(models.Flowcell.flowcellname == flowcell_name)
+            .one()
+        )
+        return query.document_path, query.runname
 
     def document_path(self, flowcell_name: str) -> str:
         """Get the latest document path of a flowcell from supportparams"""
@@ -7,17 +7,21 @@
 
 import datetime
 import logging
+import os
+from itertools import groupby
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Set
 
 from cg.apps.crunchy import files
 from cg.apps.slurm.slurm_api import SlurmAPI
 from cg.constants import FASTQ_DELTA
 from cg.models import CompressionData
 from cg.models.slurm.sbatch import Sbatch
+from cg.utils.files import get_dir_entry_names
 from cgmodels.crunchy.metadata import CrunchyFile, CrunchyMetadata
 
 from .sbatch import (
+    FASTQ_TO_SPRING_ARRAY_VARIABLES,
     FASTQ_TO_SPRING_COMMANDS,
     FASTQ_TO_SPRING_ERROR,
     SPRING_TO_FASTQ_COMMANDS,
@@ -58,11 +62,13 @@ class CrunchyAPI:
         if compression_obj.pending_exists():
             LOG.info("Compression/decompression is pending for %s", compression_obj.run_name)
             return True
-        LOG.info("Compression/decompression is not running")
+        LOG.debug("Compression/decompression is not running")
         return False
 
     @staticmethod
-    def is_fastq_compression_possible(compression_obj: CompressionData) -> bool:
+    def is_fastq_compression_possible(
+        compression_obj: CompressionData, file_names: Optional[Set[str]] = None
+    ) -> bool:
         """Check if FASTQ compression is possible
 
         There are three possible answers to this question:
@@ -70,11 +76,17 @@ class CrunchyAPI:
          - Compression is running          -> Compression NOT possible
          - SPRING archive exists           -> Compression NOT possible
          - Not compressed and not running  -> Compression IS possible
+
+        The pending flag and the SPRING archive are looked up in one listing of their directory,
+        'file_names' can be given by callers that have already listed it
         """
-        if CrunchyAPI.is_compression_pending(compression_obj):
+        if file_names is None:
+            file_names = get_dir_entry_names(compression_obj.stub.parent)
+        if compression_obj.pending_path.name in file_names:
+            LOG.info("Compression/decompression is pending for %s", compression_obj.run_name)
             return False
 
-        if compression_obj.spring_exists():
+        if compression_obj.spring_path.name in file_names:
             LOG.info("SPRING file found")
             return False
 
@@ -83,7 +95,22 @@ class CrunchyAPI:
         return True
 
     @staticmethod
-    def is_spring_decompression_possible(compression_obj: CompressionData) -> bool:
+    def get_existing_file_names(compression_objs: List[CompressionData]) -> List[Set[str]]:
+        """Return the names of the existing files next to each compression stub
+
+        Each directory is only listed once
+        """
+        dir_file_names: Dict[Path, Set[str]] = {}
+        for compression_obj in compression_objs:
+            parent_dir: Path = compression_obj.stub.parent
+            if parent_dir not in dir_file_names:
+                dir_file_names[parent_dir] = get_dir_entry_names(parent_dir)
+        return [dir_file_names[compression_obj.stub.parent] for compression_obj in compression_objs]
+
+    @staticmethod
+    def is_spring_decompression_possible(
+        compression_obj: CompressionData, file_names: Optional[Set[str]] = None
+    ) -> bool:
         """Check if SPRING decompression is possible
 
         There are three possible answers to this question:
@@ -92,16 +119,22 @@ class CrunchyAPI:
             - The FASTQ files are not compressed        -> Decompression is NOT possible
             - Compression has been performed            -> Decompression IS possible
 
+        'file_names' can be given by callers that have already listed the directory of the files
         """
-        if compression_obj.pending_exists():
+        if file_names is None:
+            file_names = get_dir_entry_names(compression_obj.stub.parent)
+        if compression_obj.pending_path.name in file_names:
             LOG.info("Compression/decompression is pending for %s", compression_obj.run_name)
             return False
 
-        if not compression_obj.spring_exists():
+        if compression_obj.spring_path.name not in file_names:
             LOG.info("No SPRING file found")
             return False
 
-        if compression_obj.pair_exists():
+        if (
+            compression_obj.fastq_first.name in file_names
+            and compression_obj.fastq_second.name in file_names
+        ):
             LOG.info("FASTQ files already exists")
             return False
 
@@ -110,7 +143,9 @@ class CrunchyAPI:
         return True
 
     @staticmethod
-    def is_fastq_compression_done(compression_obj: CompressionData) -> bool:
+    def is_fastq_compression_done(
+        compression_obj: CompressionData, today: Optional[datetime.date] = None
+    ) -> bool:
         """Check if FASTQ compression is finished
 
         This is checked by controlling that the SPRING files that are produced after FASTQ
@@ -125,23 +160,24 @@ class CrunchyAPI:
         Note:
         'updated_at' indicates at what date the SPRING archive was unarchived last.
         If the SPRING archive has never been unarchived 'updated_at' is None
+        'today' can be given by callers checking many runs to only look up the date once
 
         """
-        LOG.info("Check if FASTQ compression is finished")
-        LOG.info("Check if SPRING file %s exists", compression_obj.spring_path)
+        LOG.debug("Check if FASTQ compression is finished")
+        LOG.debug("Check if SPRING file %s exists", compression_obj.spring_path)
         if not compression_obj.spring_exists():
             LOG.info("No SPRING file for %s", compression_obj.run_name)
             return False
-        LOG.info("SPRING file found")
+        LOG.debug("SPRING file found")
 
-        LOG.info("Check if SPRING metadata file %s exists", compression_obj.spring_metadata_path)
+        LOG.debug("Check if SPRING metadata file %s exists", compression_obj.spring_metadata_path)
         if not compression_obj.metadata_exists():
             LOG.info("No metadata file found")
             return False
-        LOG.info("SPRING metadata file found")
+        LOG.debug("SPRING metadata file found")
 
         # We want this to raise exception if file is malformed
-        crunchy_metadata: CrunchyMetadata = files.get_crunchy_metadata(
+        crunchy_metadata: CrunchyMetadata = files.load_crunchy_metadata(
             compression_obj.spring_metadata_path
         )
 
@@ -151,9 +187,9 @@ class CrunchyAPI:
             LOG.info("FASTQ compression is done for %s", compression_obj.run_name)
             return True
 
-        LOG.info("Files where unpacked %s", updated_at)
+        LOG.debug("Files where unpacked %s", updated_at)
 
-        if not CrunchyAPI.check_if_update_spring(updated_at):
+        if not CrunchyAPI.check_if_update_spring(updated_at, today=today):
             return False
 
         LOG.info("FASTQ compression is done for %s", compression_obj.run_name)
@@ -173,22 +209,30 @@ class CrunchyAPI:
         """
 
         spring_metadata_path: Path = compression_obj.spring_metadata_path
-        LOG.info("Check if SPRING metadata file %s exists", spring_metadata_path)
+        LOG.debug("Check if SPRING metadata file %s exists", spring_metadata_path)
 
         if not compression_obj.metadata_exists():
             LOG.info("No SPRING metadata file found")
             return False
 
         # We want this to exit hard if the metadata is malformed
-        crunchy_metadata: CrunchyMetadata = files.get_crunchy_metadata(spring_metadata_path)
+        crunchy_metadata: CrunchyMetadata = files.load_crunchy_metadata(spring_metadata_path)
 
-        for file_info in crunchy_metadata.files:
-            if not Path(file_info.path).exists():
-                LOG.info("File %s does not exist", file_info.path)
-                return False
-            if not file_info.updated:
-                LOG.info("Files have not been unarchived")
-                return False
+        # Check the files one directory at a time so each directory is only listed once
+        sorted_files: List[CrunchyFile] = sorted(
+            crunchy_metadata.files, key=lambda file_info: os.path.dirname(file_info.path)
+        )
+        for parent_dir, dir_files in groupby(
+            sorted_files, key=lambda file_info: os.path.dirname(file_info.path)
+        ):
+            dir_entry_names: Set[str] = get_dir_entry_names(parent_dir)
+            for file_info in dir_files:
+                if os.path.basename(file_info.path) not in dir_entry_names:
+                    LOG.info("File %s does not exist", file_info.path)
+                    return False
+                if not file_info.updated:
+                    LOG.info("Files have not been unarchived")
+                    return False
 
         LOG.info("SPRING decompression is done for run %s", compression_obj.run_name)
 
@@ -247,6 +291,72 @@ class CrunchyAPI:
         LOG.info("Fastq compression running as job %s", sbatch_number)
         return sbatch_number
 
+    def fastq_to_spring_batch(self, compression_objs: List[CompressionData], sample_id: str) -> int:
+        """
+        Compress the FASTQ files of several runs into SPRING with one sbatch job array
+
+        Each task in the array picks its files by SLURM_ARRAY_TASK_ID
+        """
+        for compression_obj in compression_objs:
+            CrunchyAPI.create_pending_file(
+                pending_path=compression_obj.pending_path, dry_run=self.dry_run
+            )
+        # The logs of the whole batch go next to the files of the first run
+        log_dir: Path = files.get_log_dir(compression_objs[0].spring_path)
+        batch_name: str = "_".join([sample_id, str(len(compression_objs)), "runs"])
+        task_values = {
+            "fastq_first": '"${FASTQ_FIRST[$SLURM_ARRAY_TASK_ID]}"',
+            "fastq_second": '"${FASTQ_SECOND[$SLURM_ARRAY_TASK_ID]}"',
+            "spring_path": '"${SPRING_PATH[$SLURM_ARRAY_TASK_ID]}"',
+            "pending_path": '"${PENDING_PATH[$SLURM_ARRAY_TASK_ID]}"',
+            "tmp_dir": '"${TMP_DIR[$SLURM_ARRAY_TASK_ID]}"',
+        }
+        array_variables = FASTQ_TO_SPRING_ARRAY_VARIABLES.format(
+            fastq_first=" ".join(str(obj.fastq_first) for obj in compression_objs),
+            fastq_second=" ".join(str(obj.fastq_second) for obj in compression_objs),
+            spring_path=" ".join(str(obj.spring_path) for obj in compression_objs),
+            pending_path=" ".join(str(obj.pending_path) for obj in compression_objs),
+            tmp_dir=" ".join(
+                files.get_tmp_dir(
+                    prefix="spring_", suffix="_compress", base=obj.analysis_dir.as_posix()
+                )
+                for obj in compression_objs
+            ),
+        )
+        error_function = FASTQ_TO_SPRING_ERROR.format(
+            spring_path=task_values["spring_path"], pending_path=task_values["pending_path"]
+        )
+        commands = array_variables + FASTQ_TO_SPRING_COMMANDS.format(
+            conda_env=self.crunchy_env, **task_values
+        )
+        sbatch_info = {
+            "job_name": "_".join([batch_name, "fastq_to_spring"]),
+            "account": self.slurm_account,
+            "number_tasks": 12,
+            "memory": 50,
+            "log_dir": log_dir.as_posix(),
+            "email": self.mail_user,
+            "hours": 24,
+            "commands": commands,
+            "error": error_function,
+            "array_job": True,
+        }
+        sbatch_content: str = self.slurm_api.generate_sbatch_content(Sbatch.parse_obj(sbatch_info))
+        sbatch_path: Path = files.get_fastq_to_spring_sbatch_path(
+            log_dir=log_dir, run_name=batch_name
+        )
+        sbatch_number: int = self.slurm_api.submit_sbatch(
+            sbatch_content=sbatch_content,
+            sbatch_path=sbatch_path,
+            array=f"0-{len(compression_objs) - 1}",
+        )
+        LOG.info(
+            "Fastq compression of %s runs running as job array %s",
+            len(compression_objs),
+            sbatch_number,
+        )
+        return sbatch_number
+
     def spring_to_fastq(self, compression_obj: CompressionData, sample_id: str = "") -> int:
         """
         Decompress SPRING into FASTQ by submitting sbatch script to SLURM
@@ -256,10 +366,12 @@ class CrunchyAPI:
             pending_path=compression_obj.pending_path, dry_run=self.dry_run
         )
         # Fetch the metadata information from a spring metadata file
-        crunchy_metadata: CrunchyMetadata = files.get_crunchy_metadata(
+        crunchy_metadata: CrunchyMetadata = files.load_crunchy_metadata(
             compression_obj.spring_metadata_path
         )
         files_info: Dict[str, CrunchyFile] = files.get_spring_archive_files(crunchy_metadata)
+        checksum_first: str = files_info["fastq_first"].checksum
+        checksum_second: str = files_info["fastq_second"].checksum
         log_dir = files.get_log_dir(compression_obj.spring_path)
 
         error_function = SPRING_TO_FASTQ_ERROR.format(
@@ -277,8 +389,8 @@ class CrunchyAPI:
             fastq_second=compression_obj.fastq_second,
             spring_path=compression_obj.spring_path,
             pending_path=compression_obj.pending_path,
-            checksum_first=files_info["fastq_first"].checksum,
-            checksum_second=files_info["fastq_second"].checksum,
+            checksum_first=checksum_first,
+            checksum_second=checksum_second,
         )
 
         sbatch_info = {
@@ -303,11 +415,16 @@ class CrunchyAPI:
         return sbatch_number
 
     @staticmethod
-    def check_if_update_spring(file_date: datetime.date) -> bool:
-        """Check if date is older than FASTQ_DELTA (21 days)"""
-        delta = file_date + datetime.timedelta(days=FASTQ_DELTA)
-        now = datetime.datetime.now()
-        if delta > now.date():
+    def check_if_update_spring(
+        file_date: datetime.date, today: Optional[datetime.date] = None
+    ) -> bool:
+        """Check if date is older than FASTQ_DELTA (21 days)
+
+        Only the days are compared, so the file date may also be given as a datetime
+        """
+        if today is None:
+            today = datetime.date.today()
+        if today.toordinal() - file_date.toordinal() < FASTQ_DELTA:
             LOG.info("FASTQ files are not old enough")
             return False
         return True
@@ -1,7 +1,10 @@
 import json
 import logging
+import os
 import tempfile
+import uuid
 from datetime import datetime
+from functools import lru_cache
 from json.decoder import JSONDecodeError
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -11,6 +14,23 @@ from cgmodels.crunchy.metadata import CrunchyFile, CrunchyMetadata
 
 LOG = logging.getLogger(__name__)
 
+ARCHIVE_FILE_NAMES = {
+    "first_read": "fastq_first",
+    "second_read": "fastq_second",
+    "spring": "spring",
+}
+
+
+def _read_bytes(file_path: Path) -> bytes:
+    """Read the content of a file without updating its access time, where that is permitted"""
+    try:
+        file_descriptor: int = os.open(file_path, os.O_RDONLY | getattr(os, "O_NOATIME", 0))
+    except PermissionError:
+        # O_NOATIME is only allowed for the owner of the file
+        file_descriptor = os.open(file_path, os.O_RDONLY)
+    with os.fdopen(file_descriptor, "rb") as infile:
+        return infile.read()
+
 
 # Methods to get file information
 def get_log_dir(file_path: Path) -> Path:
@@ -29,25 +49,26 @@ def get_spring_to_fastq_sbatch_path(log_dir: Path, run_name: str = None) -> Path
 
 
 def get_tmp_dir(prefix: str, suffix: str, base: str = None) -> str:
-    """Create a temporary directory and return the path to it"""
+    """Return a unique path for a temporary directory
 
-    with tempfile.TemporaryDirectory(prefix=prefix, suffix=suffix, dir=base) as dir_name:
-        tmp_dir_path = dir_name
-
-    LOG.info("Created temporary dir %s", tmp_dir_path)
+    The directory is not created here, the sbatch script creates and removes it when the job runs
+    """
+    tmp_dir_path: str = os.path.join(
+        base or tempfile.gettempdir(), "".join([prefix, uuid.uuid4().hex, suffix])
+    )
+    LOG.debug("Using temporary dir %s", tmp_dir_path)
     return tmp_dir_path
 
 
 def get_crunchy_metadata(metadata_path: Path) -> CrunchyMetadata:
     """Validate content of metadata file and return mapped content"""
     LOG.info("Fetch SPRING metadata from %s", metadata_path)
-    with open(metadata_path, "r") as infile:
-        try:
-            content: List[Dict[str, str]] = json.load(infile)
-        except JSONDecodeError:
-            message = "No content in SPRING metadata file"
-            LOG.warning(message)
-            raise SyntaxError(message)
+    try:
+        content: List[Dict[str, str]] = json.loads(_read_bytes(metadata_path))
+    except JSONDecodeError:
+        message = "No content in SPRING metadata file"
+        LOG.warning(message)
+        raise SyntaxError(message)
     metadata = CrunchyMetadata(files=content)
 
     if len(metadata.files) != 3:
@@ -58,6 +79,24 @@ def get_crunchy_metadata(metadata_path: Path) -> CrunchyMetadata:
     return metadata
 
 
+@lru_cache(maxsize=1024)
+def _get_cached_crunchy_metadata(metadata_path: str, mtime_ns: int, size: int) -> CrunchyMetadata:
+    """Cache the mapped content of a metadata file per modification time and size"""
+    return get_crunchy_metadata(Path(metadata_path))
+
+
+def load_crunchy_metadata(metadata_path: Path) -> CrunchyMetadata:
+    """Return the mapped content of a metadata file, only reading it again if it has changed
+
+    The returned metadata is shared between calls and should not be modified
+    """
+    metadata_path_string: str = os.fspath(metadata_path)
+    stat_result: os.stat_result = os.stat(metadata_path_string)
+    return _get_cached_crunchy_metadata(
+        metadata_path_string, stat_result.st_mtime_ns, stat_result.st_size
+    )
+
+
 def get_file_updated_at(crunchy_metadata: CrunchyMetadata) -> Optional[datetime.date]:
     """Check if a SPRING metadata file has been updated and return the date when updated"""
     return crunchy_metadata.files[0].updated
@@ -72,19 +111,15 @@ def get_spring_archive_files(crunchy_metadata: CrunchyMetadata) -> Dict[str, Cru
                 "spring" : {file_info},
               }
     """
-    names_map = {"first_read": "fastq_first", "second_read": "fastq_second", "spring": "spring"}
-    archive_files = {}
-    for file_info in crunchy_metadata.files:
-        file_name = names_map[file_info.file]
-        archive_files[file_name] = file_info
-    return archive_files
+    return {ARCHIVE_FILE_NAMES[file_info.file]: file_info for file_info in crunchy_metadata.files}
 
 
 def update_metadata_date(spring_metadata_path: Path) -> None:
     """Update date in the SPRING metadata file to today date"""
 
     now: datetime = get_date()
-    spring_metadata: CrunchyMetadata = get_crunchy_metadata(spring_metadata_path)
+    # The cached metadata is shared, update a copy of it
+    spring_metadata: CrunchyMetadata = load_crunchy_metadata(spring_metadata_path).copy(deep=True)
     LOG.info("Adding today date to SPRING metadata file")
     for file_info in spring_metadata.files:
         file_info.updated = now.date()
@@ -92,3 +127,5 @@ def update_metadata_date(spring_metadata_path: Path) -> None:
     content: dict = json.loads(spring_metadata.json(exclude_none=True))
     with open(spring_metadata_path, "w") as outfile:
         outfile.write(json.dumps(content["files"]))
+    # The file could be rewritten within the resolution of its modification time
+    _get_cached_crunchy_metadata.cache_clear()
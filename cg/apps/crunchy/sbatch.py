@@ -29,6 +29,15 @@ then
 fi
 """
 
+# Bash arrays with one value per task in a job array, indexed by SLURM_ARRAY_TASK_ID
+FASTQ_TO_SPRING_ARRAY_VARIABLES = """
+FASTQ_FIRST=({fastq_first})
+FASTQ_SECOND=({fastq_second})
+SPRING_PATH=({spring_path})
+PENDING_PATH=({pending_path})
+TMP_DIR=({tmp_dir})
+"""
+
 FASTQ_TO_SPRING_COMMANDS = """
 source activate {conda_env}
 
@@ -2,7 +2,6 @@
     Module for mutacc-auto API
 """
 
-import copy
 import json
 import logging
 import subprocess
@@ -35,7 +34,7 @@ class MutaccAutoAPI:
 
         """
 
-        extract_call = copy.deepcopy(self.base_call)
+        extract_call = list(self.base_call)
 
         def json_default_decoder(obj):
             """decode to str if object is not serializable"""
@@ -61,8 +60,7 @@ class MutaccAutoAPI:
         Upload the cases and extracted reads to mutacc DB
         """
 
-        import_call = copy.deepcopy(self.base_call)
-        import_call.extend(["import"])
+        import_call = self.base_call + ["import"]
 
         run_command(import_call)
 
@@ -1,9 +1,8 @@
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import openpyxl
-from openpyxl.cell.cell import Cell
 from openpyxl.workbook import Workbook
 from openpyxl.worksheet.worksheet import Worksheet
 from pydantic import parse_obj_as
@@ -67,13 +66,12 @@ class ExcelOrderformParser(OrderformParser):
 
     @staticmethod
     def get_sample_row_info(
-        row: Tuple[Cell], header_row: List[str], empty_row_found: bool
+        row: Tuple[Any, ...], header_row: List[str], empty_row_found: bool
     ) -> Optional[dict]:
         """Convert an excel row with sample data into a dict with sample info"""
         values = []
-        cell: Cell
-        for cell in row:
-            value = str(cell.value)
+        for cell_value in row:
+            value = str(cell_value)
             if value == "None":
                 value = ""
             if value == "NA":
@@ -94,24 +92,25 @@ class ExcelOrderformParser(OrderformParser):
         return sample_dict
 
     @staticmethod
-    def get_header(rows: List[Tuple[Cell]]) -> List[str]:
+    def get_header(rows: Iterator[Tuple[Any, ...]]) -> List[str]:
+        """Consume the rows up to and including the header row and return the header"""
         header_row: List[str] = []
         header = False
         for row in rows:
             if header:
-                return [cell.value for cell in row]
-            if row[0].value == "<TABLE HEADER>":
+                return list(row)
+            if row[0] == "<TABLE HEADER>":
                 LOG.debug("Found header row")
                 header = True
         return header_row
 
     @staticmethod
-    def get_raw_samples(rows: List[Tuple[Cell]], header_row: List[str]) -> List[dict]:
+    def get_raw_samples(rows: Iterator[Tuple[Any, ...]], header_row: List[str]) -> List[dict]:
         raw_samples: List[dict] = []
         sample_rows = False
         empty_row_found = False
         for row in rows:
-            if row[0].value == "</SAMPLE ENTRIES>":
+            if row[0] == "</SAMPLE ENTRIES>":
                 LOG.debug("End of samples info")
                 return raw_samples
 
@@ -124,7 +123,7 @@ class ExcelOrderformParser(OrderformParser):
                 else:
                     empty_row_found = True
 
-            elif row[0].value == "<SAMPLE ENTRIES>":
+            elif row[0] == "<SAMPLE ENTRIES>":
                 LOG.debug("Found samples row")
                 sample_rows = True
         return raw_samples
@@ -132,8 +131,8 @@ class ExcelOrderformParser(OrderformParser):
     @staticmethod
     def relevant_rows(orderform_sheet: Worksheet) -> List[Dict[str, str]]:
         """Get the relevant rows from an order form sheet."""
-        # orderform_sheet.rows is a generator. Convert to list to be able to iterate multiple times
-        rows = list(orderform_sheet.rows)
+        # The header comes before the samples, read both in one pass over the cell values
+        rows: Iterator[Tuple[Any, ...]] = orderform_sheet.iter_rows(values_only=True)
         header_row: List[str] = ExcelOrderformParser.get_header(rows)
         return ExcelOrderformParser.get_raw_samples(rows=rows, header_row=header_row)
 
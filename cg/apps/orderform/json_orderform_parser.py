@@ -5,6 +5,7 @@ from cg.constants import DataDelivery, Pipeline
 from cg.exc import OrderFormError
 from cg.meta.orders import OrderType
 from cg.models.orders.json_sample import JsonSample
+from pydantic import parse_obj_as
 
 
 class JsonOrderformParser(OrderformParser):
@@ -64,10 +65,12 @@ class JsonOrderformParser(OrderformParser):
     def parse_orderform(self, order_data: dict) -> None:
         """Parse order form in JSON format."""
 
-        self.samples = [JsonSample(**sample_data) for sample_data in order_data.get("samples", [])]
-        if not self.samples:
+        raw_samples: List[dict] = order_data.get("samples", [])
+        if not raw_samples:
             raise OrderFormError("orderform doesn't contain any samples")
 
+        self.samples: List[JsonSample] = parse_obj_as(List[JsonSample], raw_samples)
+
         self.project_type = self.get_project_type()
         self.delivery_type = self.get_data_delivery()
         self.customer_id = order_data["customer"].lower()
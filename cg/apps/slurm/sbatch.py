@@ -3,8 +3,8 @@ SBATCH_HEADER_TEMPLATE = """#! /bin/bash
 #SBATCH --account={account}
 #SBATCH --ntasks={number_tasks}
 #SBATCH --mem={memory}G
-#SBATCH --error={log_dir}/{job_name}.stderr
-#SBATCH --output={log_dir}/{job_name}.stdout
+#SBATCH --error={log_dir}/{log_name}.stderr
+#SBATCH --output={log_dir}/{log_name}.stdout
 #SBATCH --mail-type=FAIL
 #SBATCH --mail-user={email}
 #SBATCH --time={hours}:{minutes}:00
@@ -41,7 +41,11 @@ class SlurmAPI:
 
     @staticmethod
     def generate_sbatch_header(sbatch_parameters: Sbatch) -> str:
-        return SBATCH_HEADER_TEMPLATE.format(**sbatch_parameters.dict())
+        log_name: str = sbatch_parameters.job_name
+        if sbatch_parameters.array_job:
+            # Each task in a job array writes its own logs, named by job id and task id
+            log_name = "_".join([log_name, "%A", "%a"])
+        return SBATCH_HEADER_TEMPLATE.format(**sbatch_parameters.dict(), log_name=log_name)
 
     @staticmethod
     def generate_dragen_sbatch_header(sbatch_parameters: Sbatch) -> str:
@@ -64,9 +68,11 @@ class SlurmAPI:
         with open(sbatch_path, mode="w+t") as sbatch_file:
             sbatch_file.write(sbatch_content)
 
-    def submit_sbatch_job(self, sbatch_path: Path) -> int:
+    def submit_sbatch_job(self, sbatch_path: Path, array: Optional[str] = None) -> int:
         LOG.info("Submit sbatch %s", sbatch_path)
         sbatch_parameters: List[str] = [str(sbatch_path)]
+        if array:
+            sbatch_parameters = ["--array", array] + sbatch_parameters
         self.process.run_command(parameters=sbatch_parameters, dry_run=self.dry_run)
         if self.process.stderr:
             LOG.info(self.process.stderr)
@@ -80,12 +86,15 @@ class SlurmAPI:
                 job_number = 123456
         return job_number
 
-    def submit_sbatch(self, sbatch_content: str, sbatch_path: Path) -> int:
+    def submit_sbatch(
+        self, sbatch_content: str, sbatch_path: Path, array: Optional[str] = None
+    ) -> int:
         """Submit sbatch file to slurm.
 
+        Submit it as a job array if the array indices are given, e.g. "0-9".
         Return the slurm job id
         """
         SlurmAPI.write_sbatch_file(
             sbatch_content=sbatch_content, sbatch_path=sbatch_path, dry_run=self.dry_run
         )
-        return self.submit_sbatch_job(sbatch_path=sbatch_path)
+        return self.submit_sbatch_job(sbatch_path=sbatch_path, array=array)
@@ -1,5 +1,5 @@
 import logging
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import click
 from cg.constants import PRIORITY_OPTIONS, STATUS_OPTIONS, DataDelivery, Pipeline
@@ -199,9 +199,9 @@ def family(
         LOG.error(f"{customer_id}: customer not found")
         raise click.Abort
 
+    panel_objs: Dict[str, models.Panel] = status_db.panels_by_abbrev(panels)
     for panel_id in panels:
-        panel_obj: models.Panel = status_db.panel(panel_id)
-        if panel_obj is None:
+        if panel_id not in panel_objs:
             LOG.error(f"{panel_id}: panel not found")
             raise click.Abort
 
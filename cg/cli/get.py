@@ -44,7 +44,7 @@ def sample(context: click.Context, families: bool, hide_flowcell: bool, sample_i
     status_db: Store = context.obj.status_db
     for sample_id in sample_ids:
         LOG.debug("%s: get info about sample", sample_id)
-        sample_obj: models.Sample = status_db.sample(sample_id)
+        sample_obj: models.Sample = status_db.sample_with_links(sample_id)
         if sample_obj is None:
             LOG.warning(f"{sample_id}: sample doesn't exist")
             continue
@@ -96,7 +96,7 @@ def analysis(context: CGConfig, case_id: str):
 def relations(context: CGConfig, family_id: str):
     """Get information about family relations."""
     status_db: Store = context.status_db
-    case_obj: models.Family = status_db.family(family_id)
+    case_obj: models.Family = status_db.family_with_links(family_id)
     if case_obj is None:
         LOG.error("%s: family doesn't exist", family_id)
         raise click.Abort
@@ -143,7 +143,7 @@ def family(
         )
     else:
         for family_id in family_ids:
-            case_obj: models.Family = status_db.family(family_id)
+            case_obj: models.Family = status_db.family_with_links(family_id)
             if case_obj is None:
                 LOG.error(f"{family_id}: family doesn't exist")
                 raise click.Abort
@@ -5,7 +5,7 @@ import click
 from cg.constants import CASE_ACTIONS, PRIORITY_OPTIONS
 from cg.store import Store, models
 
-from .family import family
+from .family import update_case
 
 CONFIRM = "Continue?"
 
@@ -54,7 +54,11 @@ def families(
     customer_id: Optional[str],
     identifiers: click.Tuple([str, str]),
 ):
-    """Set values on many families at the same time"""
+    """Set values on many families at the same time
+
+    The changes are committed together once all cases have been updated, nothing is changed if
+    one of the cases can not be updated
+    """
     store: Store = context.obj.status_db
     cases: List[models.Family] = _get_cases(identifiers, store)
 
@@ -71,11 +75,12 @@ def families(
         raise click.Abort
 
     for case in cases:
-        context.invoke(
-            family,
-            action=action,
-            priority=priority,
-            panels=panels,
+        update_case(
+            status_db=store,
             family_id=case.internal_id,
+            action=action,
             customer_id=customer_id,
+            panels=panels,
+            priority=priority,
         )
+    store.commit()
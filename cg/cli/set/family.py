@@ -1,6 +1,6 @@
 """Set case attributes in the status database"""
 import logging
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 import click
 
 from cg.apps.avatar.api import Avatar
@@ -47,13 +47,39 @@ def family(
 ):
     """Update information about a case."""
     status_db: Store = context.status_db
+    update_case(
+        status_db=status_db,
+        family_id=family_id,
+        action=action,
+        avatar_url=avatar_url,
+        customer_id=customer_id,
+        data_analysis=data_analysis,
+        data_delivery=data_delivery,
+        panels=panels,
+        priority=priority,
+    )
+    status_db.commit()
+
+
+def update_case(
+    status_db: Store,
+    family_id: str,
+    action: Optional[str] = None,
+    avatar_url: Optional[str] = None,
+    customer_id: Optional[str] = None,
+    data_analysis: Optional[Pipeline] = None,
+    data_delivery: Optional[DataDelivery] = None,
+    panels: Optional[Tuple[str]] = None,
+    priority: Optional[str] = None,
+) -> None:
+    """Update the information about a case without committing the changes"""
+    if not any([action, avatar_url, panels, priority, customer_id, data_analysis, data_delivery]):
+        LOG.error("Nothing to change")
+        raise click.Abort
     case_obj: models.Family = status_db.family(family_id)
     if case_obj is None:
         LOG.error("Can't find case %s,", family_id)
         raise click.Abort
-    if not any([action, avatar_url, panels, priority, customer_id, data_analysis, data_delivery]):
-        LOG.error("Nothing to change")
-        raise click.Abort
     if action:
         LOG.info("Update action: %s -> %s", case_obj.action or "NA", action)
         case_obj.action = action
@@ -67,24 +93,22 @@ def family(
         if customer_obj is None:
             LOG.error("Unknown customer: %s", customer_id)
             raise click.Abort
-        LOG.info(f"Update customer: {case_obj.customer.internal_id} -> {customer_id}")
+        LOG.info("Update customer: %s -> %s", case_obj.customer.internal_id, customer_id)
         case_obj.customer = customer_obj
     if data_analysis:
-        LOG.info(f"Update data_analysis: {case_obj.data_analysis or 'NA'} -> {data_analysis}")
+        LOG.info("Update data_analysis: %s -> %s", case_obj.data_analysis or "NA", data_analysis)
         case_obj.data_analysis = data_analysis
     if data_delivery:
-        LOG.info(f"Update data_delivery: {case_obj.data_delivery or 'NA'} -> {data_delivery}")
+        LOG.info("Update data_delivery: %s -> %s", case_obj.data_delivery or "NA", data_delivery)
         case_obj.data_delivery = data_delivery
     if panels:
-        for panel_id in panels:
-            panel_obj: models.Panel = status_db.panel(panel_id)
-            if panel_obj is None:
-                LOG.error(f"unknown gene panel: {panel_id}")
-                raise click.Abort
-        LOG.info(f"Update panels: {', '.join(case_obj.panels)} -> {', '.join(panels)}")
+        panel_objs: Dict[str, models.Panel] = status_db.panels_by_abbrev(panels)
+        unknown_panels: List[str] = [panel_id for panel_id in panels if panel_id not in panel_objs]
+        if unknown_panels:
+            LOG.error("unknown gene panels: %s", ", ".join(unknown_panels))
+            raise click.Abort
+        LOG.info("Update panels: %s -> %s", ", ".join(case_obj.panels), ", ".join(panels))
         case_obj.panels = panels
     if priority:
-        LOG.info(f"update priority: {case_obj.priority_human} -> {priority}")
+        LOG.info("update priority: %s -> %s", case_obj.priority_human, priority)
         case_obj.priority_human = priority
-
-    status_db.commit()
@@ -6,9 +6,12 @@ from cg.models.cg_config import CGConfig
 from cg.store import Store, models
 from ansi.colour import fg
 from ansi.colour.fx import reset
+from sqlalchemy.orm import joinedload, selectinload
 from tabulate import tabulate
 
 STATUS_OPTIONS = ["pending", "running", "completed", "failed", "error"]
+BOOL_SYMBOLS = {None: "-", True: "✓", False: "✗"}
+BOOL_SYMBOLS_HIDE_FALSE = {None: "-", True: "✓", False: ""}
 CASE_HEADERS_LONG = [
     "Case",
     "Workflow",
@@ -65,18 +68,10 @@ def present_bool(a_dict, param, show_false=False):
     """presents boolean value in a human friendly format"""
     value = a_dict.get(param)
 
-    if show_false:
-        return (
-            "-"
-            if value is None
-            else "✓"
-            if value is True
-            else "✗"
-            if value is False
-            else str(value)
-        )
+    if value is not None and not isinstance(value, bool):
+        return str(value)
 
-    return "-" if value is None else "✓" if value is True else "" if value is False else str(value)
+    return (BOOL_SYMBOLS if show_false else BOOL_SYMBOLS_HIDE_FALSE)[value]
 
 
 def present_date(a_dict, param, show_negative, show_time):
@@ -210,16 +205,17 @@ def cases(
     elif output_type in ("date", "datetime"):
         case_header = CASE_HEADERS_LONG
 
+    show_time = output_type == "datetime"
+
     for case in records:
 
         tat_number = case.get("tat")
         max_tat = case.get("max_tat")
+        samples_received: bool = case.get("samples_received_bool")
+        samples_delivered: bool = case.get("samples_delivered_bool")
+        case_external: bool = case.get("case_external_bool")
 
-        if (
-            case.get("samples_received_bool")
-            and case.get("samples_delivered_bool")
-            and tat_number <= max_tat
-        ):
+        if samples_received and samples_delivered and tat_number <= max_tat:
             tat_color = fg.green
         elif tat_number == max_tat:
             tat_color = fg.yellow
@@ -236,21 +232,15 @@ def cases(
         if name:
             title = f"{title} ({case.get('name')})"
 
-        if (
-            not case.get("case_external_bool")
-            and case.get("samples_received_bool")
-            and case.get("samples_delivered_bool")
-        ):
+        if not case_external and samples_received and samples_delivered:
             tat = f"{tat_number}/{max_tat}" + color_end
-        elif case.get("case_external_bool") and case.get("analysis_uploaded_bool"):
+        elif case_external and case.get("analysis_uploaded_bool"):
             tat = f"{tat_number}/{max_tat}" + color_end
         else:
             tat = f"({tat_number})/{max_tat}" + color_end
 
         data_analysis = f"{case.get('data_analysis')}"
 
-        show_time = output_type == "datetime"
-
         ordered = present_date(case, "ordered_at", verbose, show_time)
 
         if output_type == "bool":
@@ -353,7 +343,10 @@ def cases(
 def samples(context: CGConfig, skip: int):
     """View status of samples."""
     status_db: Store = context.status_db
-    records: Iterable[models.Sample] = status_db.samples().offset(skip).limit(30)
+    records: Iterable[models.Sample] = (
+        status_db.samples().options(joinedload(models.Sample.customer)).offset(skip).limit(30)
+    )
+    lines: List[str] = []
     for record in records:
         message = f"{record.internal_id} ({record.customer.internal_id})"
         if record.sequenced_at:
@@ -368,7 +361,9 @@ def samples(context: CGConfig, skip: int):
         else:
             color = "white"
             message += " [NOT RECEIVED]"
-        click.echo(click.style(message, fg=color))
+        lines.append(click.style(message, fg=color))
+    if lines:
+        click.echo("\n".join(lines))
 
 
 @status.command()
@@ -378,7 +373,10 @@ def families(context: CGConfig, skip: int):
     """View status of families."""
     click.echo("red: prio > 1, blue: prio = 1, green: completed, yellow: action")
     status_db: Store = context.status_db
-    records: List[models.Family] = status_db.families().offset(skip).limit(30)
+    records: List[models.Family] = (
+        status_db.families().options(selectinload(models.Family.analyses)).offset(skip).limit(30)
+    )
+    lines: List[str] = []
     for case_obj in records:
         color = "red" if case_obj.priority > 1 else "blue"
         message = f"{case_obj.internal_id} ({case_obj.priority})"
@@ -388,4 +386,6 @@ def families(context: CGConfig, skip: int):
         if case_obj.action:
             message += f" [{case_obj.action.upper()}]"
             color = "yellow"
-        click.echo(click.style(message, fg=color))
+        lines.append(click.style(message, fg=color))
+    if lines:
+        click.echo("\n".join(lines))
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List
 
 STATS_HEADER: List[str] = [
     "sample",
@@ -11,3 +11,6 @@ STATS_HEADER: List[str] = [
     "%Q30",
     "MeanQscore",
 ]
+
+# Lowest q30 percentage of a sample on a flowcell for its reads to be counted, per sequencer type
+Q30_THRESHOLDS: Dict[str, int] = {"hiseqga": 80, "hiseqx": 75, "novaseq": 75}
@@ -2,6 +2,7 @@
     API for compressing files. Functionality to compress FASTQ, decompress SPRING and clean files
 """
 
+import datetime
 import logging
 from pathlib import Path
 from typing import Optional, List
@@ -55,6 +56,7 @@ class CompressAPI:
             return False
 
         all_ok = True
+        compression_objects: List[CompressionData] = []
         for run_name in sample_fastq_dict:
             LOG.info("Check if compression possible for run %s", run_name)
             compression_object = sample_fastq_dict[run_name]["compression_data"]
@@ -80,7 +82,13 @@ class CompressAPI:
                 compression_object.fastq_second,
                 sample_id,
             )
-            self.crunchy_api.fastq_to_spring(compression_object, sample_id=sample_id)
+            compression_objects.append(compression_object)
+
+        if len(compression_objects) == 1:
+            self.crunchy_api.fastq_to_spring(compression_objects[0], sample_id=sample_id)
+        elif compression_objects:
+            # Submit the runs of the sample as one job array instead of one job per run
+            self.crunchy_api.fastq_to_spring_batch(compression_objects, sample_id=sample_id)
 
         return all_ok
 
@@ -111,6 +119,9 @@ class CompressAPI:
             )
 
             self.crunchy_api.spring_to_fastq(compression_obj, sample_id=sample_id)
+            if self.dry_run:
+                LOG.info("Would update date in %s", compression_obj.spring_metadata_path)
+                continue
             update_metadata_date(compression_obj.spring_metadata_path)
 
         return True
@@ -131,11 +142,12 @@ class CompressAPI:
             return False
 
         all_cleaned = True
+        today = datetime.date.today()
         for run_name in sample_fastq_dict:
 
             compression_object = sample_fastq_dict[run_name]["compression_data"]
 
-            if not self.crunchy_api.is_fastq_compression_done(compression_object):
+            if not self.crunchy_api.is_fastq_compression_done(compression_object, today=today):
                 LOG.info("FASTQ compression not done for sample %s, run %s", sample_id, run_name)
                 all_cleaned = False
                 continue
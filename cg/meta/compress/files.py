@@ -2,6 +2,7 @@
 
 import datetime
 import logging
+import os
 from pathlib import Path
 from typing import Dict, List
 
@@ -10,12 +11,15 @@ from cg.constants.compression import (
     FASTQ_DATETIME_DELTA,
     FASTQ_FIRST_READ_SUFFIX,
     FASTQ_SECOND_READ_SUFFIX,
+    SPRING_SUFFIX,
 )
 from cg.models import CompressionData
 from housekeeper.store import models as hk_models
 
 LOG = logging.getLogger(__name__)
 
+FASTQ_READ_SUFFIXES = (FASTQ_FIRST_READ_SUFFIX, FASTQ_SECOND_READ_SUFFIX)
+
 # Functions to get common files
 
 
@@ -40,10 +44,8 @@ def get_hk_files_dict(
 
 def is_file_in_version(version_obj: hk_models.Version, path: Path) -> bool:
     """Check if a file is in a certain version"""
-    for file_obj in version_obj.files:
-        if file_obj.path == str(path):
-            return True
-    return False
+    path_string: str = os.fspath(path)
+    return any(file_obj.path == path_string for file_obj in version_obj.files)
 
 
 # Functions to get FASTQ like files
@@ -58,8 +60,9 @@ def get_spring_paths(version_obj: hk_models.Version) -> List[CompressionData]:
         return spring_paths
 
     for file_path in hk_files_dict:
-        if file_path.suffix == ".spring":
-            spring_paths.append(CompressionData(file_path.with_suffix("")))
+        file_string = str(file_path)
+        if file_string.endswith(SPRING_SUFFIX):
+            spring_paths.append(CompressionData(Path(file_string[: -len(SPRING_SUFFIX)])))
 
     return spring_paths
 
@@ -72,10 +75,9 @@ def get_fastq_stub(fastq_path: Path) -> Path:
         file_prefix = /home/fastq_files/A_sequencing_run
     """
     fastq_string = str(fastq_path)
-    if FASTQ_FIRST_READ_SUFFIX in fastq_string:
-        return Path(fastq_string.replace(FASTQ_FIRST_READ_SUFFIX, ""))
-    if FASTQ_SECOND_READ_SUFFIX in fastq_string:
-        return Path(fastq_string.replace(FASTQ_SECOND_READ_SUFFIX, ""))
+    for suffix in FASTQ_READ_SUFFIXES:
+        if fastq_string.endswith(suffix):
+            return Path(fastq_string[: -len(suffix)])
     return None
 
 
@@ -10,6 +10,7 @@ from cg.apps.housekeeper.hk import HousekeeperAPI
 from cg.constants import delivery as constants
 from cg.store import Store
 from cg.store.models import Family, FamilySample, Sample
+from cg.utils.files import get_dir_entry_names
 from housekeeper.store import models as hk_models
 
 LOG = logging.getLogger(__name__)
@@ -121,12 +122,14 @@ class DeliverAPI:
             delivery_base.mkdir(parents=True, exist_ok=True)
         file_path: Path
         number_linked_files: int = 0
+        # List the delivery directory once instead of checking each out path separately
+        existing_file_names: Set[str] = get_dir_entry_names(delivery_base)
         for file_path in self.get_case_files_from_version(
             version_obj=version_obj, sample_ids=sample_ids
         ):
             # Out path should include customer names
             out_path: Path = delivery_base / file_path.name.replace(case_id, case_name)
-            if out_path.exists():
+            if out_path.name in existing_file_names:
                 LOG.warning("File %s already exists!", out_path)
                 continue
 
@@ -138,6 +141,7 @@ class DeliverAPI:
             try:
                 os.link(file_path, out_path)
                 number_linked_files += 1
+                existing_file_names.add(out_path.name)
             except FileExistsError:
                 LOG.info("Path %s exists, skipping", out_path)
 
@@ -19,7 +19,7 @@ from cg.models.orders.order import OrderIn
 from cg.store import Store, models
 
 from .lims import process_lims
-from .schema import ORDER_SCHEMES, OrderType
+from .schema import OrderType, get_order_scheme
 from .status import StatusHandler
 from .ticket_handler import TicketHandler
 
@@ -41,7 +41,7 @@ class OrdersAPI(StatusHandler):
         Main entry point for the class towards interfaces that implements it.
         """
         try:
-            ORDER_SCHEMES[project].validate(order_in.dict())
+            get_order_scheme(project).validate(order_in.dict())
         except (ValueError, TypeError) as error:
             raise OrderError(str(error))
 
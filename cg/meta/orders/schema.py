@@ -1,4 +1,5 @@
 from collections import Iterable
+from functools import lru_cache
 
 from pyschemes import Scheme, validators
 
@@ -29,18 +30,22 @@ class ListValidator(validators.Validator):
 
     """Validate a list of items against a schema."""
 
+    ITERABLE_VALIDATOR = validators.TypeValidator(Iterable)
+
     def __init__(self, scheme: validators.Validator, min_items: int = 0):
         super().__init__(scheme)
+        # The scheme is turned into a validator once, not per validated list
         self.__scheme = validators.Validator.create_validator(scheme)
         self.min_items = min_items
 
     def validate(self, value: Iterable):
         """Validate the list of values."""
         values = value
-        validators.TypeValidator(Iterable).validate(values)
+        self.ITERABLE_VALIDATOR.validate(values)
+        validate_item = self.__scheme.validate
         values_copy = []
         for one_value in values:
-            self.__scheme.validate(one_value)
+            validate_item(one_value)
             values_copy.append(one_value)
         if len(values_copy) < self.min_items:
             raise ValueError(f"value did not contain at least {self.min_items} items")
@@ -57,7 +62,20 @@ class TypeValidatorNone(validators.TypeValidator):
         return super().validate(value)
 
 
-class RegexValidatorNone(validators.RegexValidator):
+class StrRegexValidator(validators.RegexValidator):
+    """Validator for regex patterns that reuses one type check for all values."""
+
+    STR_VALIDATOR = validators.TypeValidator(str)
+
+    def validate(self, value):
+        """Validate the value against the precompiled regular expression"""
+        self.STR_VALIDATOR.validate(value)
+        if self.pattern.match(value):
+            return value
+        raise ValueError(f"value '{value}' did not match regex r'{self.pattern}'")
+
+
+class RegexValidatorNone(StrRegexValidator):
     """Validator for regex patterns that accepts None."""
 
     def validate(self, value):
@@ -85,50 +103,71 @@ class OptionalNone(validators.Optional):
         return self.default
 
 
+class OptionsValidator(validators.Validator):
+    """Validate that a value is one of a fixed set of options."""
+
+    def __init__(self, options: Iterable):
+        super().__init__(options)
+        self.options = frozenset(options)
+
+    def validate(self, value):
+        """Validate the value with a set lookup instead of trying each option in turn"""
+        try:
+            if value in self.options:
+                return value
+        except TypeError:
+            pass
+        raise ValueError("value did not pass 'Any' validation")
+
+
 NAME_PATTERN = r"^[A-Za-z0-9-]*$"
+# The validators are shared by all sample schemes so each is only created once
+NAME_VALIDATOR = StrRegexValidator(NAME_PATTERN)
+OPTIONAL_NAME_VALIDATOR = OptionalNone(RegexValidatorNone(NAME_PATTERN))
+OPTIONAL_STR_VALIDATOR = OptionalNone(TypeValidatorNone(str))
 
-BASE_PROJECT = {"name": str, "customer": str, "comment": OptionalNone(TypeValidatorNone(str))}
+BASE_PROJECT = {"name": str, "customer": str, "comment": OPTIONAL_STR_VALIDATOR}
 
 MIP_SAMPLE = {
     # Orderform 1508
     # Order portal specific
-    "internal_id": OptionalNone(TypeValidatorNone(str)),
+    "internal_id": OPTIONAL_STR_VALIDATOR,
     # "required for new samples"
-    "name": validators.RegexValidator(NAME_PATTERN),
+    "name": NAME_VALIDATOR,
     # customer
     "data_analysis": str,
-    "data_delivery": OptionalNone(TypeValidatorNone(str)),
-    "age_at_sampling": OptionalNone(TypeValidatorNone(str)),
+    "data_delivery": OPTIONAL_STR_VALIDATOR,
+    "age_at_sampling": OPTIONAL_STR_VALIDATOR,
     "application": str,
-    "family_name": validators.RegexValidator(NAME_PATTERN),
-    "case_internal_id": OptionalNone(TypeValidatorNone(str)),
-    "sex": OptionalNone(validators.Any(SEX_OPTIONS)),
+    "family_name": NAME_VALIDATOR,
+    "case_internal_id": OPTIONAL_STR_VALIDATOR,
+    "sex": OptionalNone(OptionsValidator(SEX_OPTIONS)),
     "tumour": bool,
-    "source": OptionalNone(TypeValidatorNone(str)),
-    "priority": OptionalNone(validators.Any(PRIORITY_OPTIONS)),
-    "volume": OptionalNone(TypeValidatorNone(str)),
-    "container": OptionalNone(validators.Any(CONTAINER_OPTIONS)),
+    "source": OPTIONAL_STR_VALIDATOR,
+    "priority": OptionalNone(OptionsValidator(PRIORITY_OPTIONS)),
+    "volume": OPTIONAL_STR_VALIDATOR,
+    "container": OptionalNone(OptionsValidator(CONTAINER_OPTIONS)),
     # "required if plate for new samples"
-    "container_name": OptionalNone(TypeValidatorNone(str)),
-    "well_position": OptionalNone(TypeValidatorNone(str)),
+    "container_name": OPTIONAL_STR_VALIDATOR,
+    "well_position": OPTIONAL_STR_VALIDATOR,
     # "Required if data analysis in Scout or vcf delivery"
     "panels": ListValidator(str, min_items=1),
-    "status": OptionalNone(validators.Any(STATUS_OPTIONS)),
+    "status": OptionalNone(OptionsValidator(STATUS_OPTIONS)),
     # "Required if samples are part of trio/family"
-    "mother": OptionalNone(RegexValidatorNone(NAME_PATTERN)),
-    "father": OptionalNone(RegexValidatorNone(NAME_PATTERN)),
+    "mother": OPTIONAL_NAME_VALIDATOR,
+    "father": OPTIONAL_NAME_VALIDATOR,
     # This information is required for panel analysis
-    "capture_kit": OptionalNone(TypeValidatorNone(str)),
+    "capture_kit": OPTIONAL_STR_VALIDATOR,
     # This information is required for panel- or exome analysis
-    "elution_buffer": OptionalNone(TypeValidatorNone(str)),
-    "tumour_purity": OptionalNone(TypeValidatorNone(str)),
+    "elution_buffer": OPTIONAL_STR_VALIDATOR,
+    "tumour_purity": OPTIONAL_STR_VALIDATOR,
     # "This information is optional for FFPE-samples for new samples"
-    "formalin_fixation_time": OptionalNone(TypeValidatorNone(str)),
-    "post_formalin_fixation_time": OptionalNone(TypeValidatorNone(str)),
-    "tissue_block_size": OptionalNone(TypeValidatorNone(str)),
+    "formalin_fixation_time": OPTIONAL_STR_VALIDATOR,
+    "post_formalin_fixation_time": OPTIONAL_STR_VALIDATOR,
+    "tissue_block_size": OPTIONAL_STR_VALIDATOR,
     # "Not Required"
-    "quantity": OptionalNone(TypeValidatorNone(str)),
-    "comment": OptionalNone(TypeValidatorNone(str)),
+    "quantity": OPTIONAL_STR_VALIDATOR,
+    "comment": OPTIONAL_STR_VALIDATOR,
     "cohorts": OptionalNone(ListValidator(str, min_items=0)),
     "synopsis": OptionalNone(str),
     "subject_id": OptionalNone(str),
@@ -139,36 +178,36 @@ MIP_SAMPLE = {
 BALSAMIC_SAMPLE = {
     # 1508 Orderform
     # Order portal specific
-    "internal_id": OptionalNone(TypeValidatorNone(str)),
+    "internal_id": OPTIONAL_STR_VALIDATOR,
     # "This information is required for new samples"
-    "name": validators.RegexValidator(NAME_PATTERN),
-    "container": OptionalNone(validators.Any(CONTAINER_OPTIONS)),
+    "name": NAME_VALIDATOR,
+    "container": OptionalNone(OptionsValidator(CONTAINER_OPTIONS)),
     "data_analysis": str,
-    "data_delivery": OptionalNone(TypeValidatorNone(str)),
+    "data_delivery": OPTIONAL_STR_VALIDATOR,
     "application": str,
-    "sex": OptionalNone(validators.Any(SEX_OPTIONS)),
-    "family_name": validators.RegexValidator(NAME_PATTERN),
-    "case_internal_id": OptionalNone(TypeValidatorNone(str)),
-    "volume": OptionalNone(TypeValidatorNone(str)),
+    "sex": OptionalNone(OptionsValidator(SEX_OPTIONS)),
+    "family_name": NAME_VALIDATOR,
+    "case_internal_id": OPTIONAL_STR_VALIDATOR,
+    "volume": OPTIONAL_STR_VALIDATOR,
     "tumour": bool,
-    "source": OptionalNone(TypeValidatorNone(str)),
-    "priority": OptionalNone(validators.Any(PRIORITY_OPTIONS)),
+    "source": OPTIONAL_STR_VALIDATOR,
+    "priority": OptionalNone(OptionsValidator(PRIORITY_OPTIONS)),
     # Required if Plate for new samples
-    "container_name": OptionalNone(TypeValidatorNone(str)),
-    "well_position": OptionalNone(TypeValidatorNone(str)),
+    "container_name": OPTIONAL_STR_VALIDATOR,
+    "well_position": OPTIONAL_STR_VALIDATOR,
     # This information is required for panel analysis
-    "capture_kit": OptionalNone(TypeValidatorNone(str)),
+    "capture_kit": OPTIONAL_STR_VALIDATOR,
     # This information is required for panel- or exome analysis
-    "elution_buffer": OptionalNone(TypeValidatorNone(str)),
-    "tumour_purity": OptionalNone(TypeValidatorNone(str)),
+    "elution_buffer": OPTIONAL_STR_VALIDATOR,
+    "tumour_purity": OPTIONAL_STR_VALIDATOR,
     # This information is optional for FFPE-samples for new samples
-    "formalin_fixation_time": OptionalNone(TypeValidatorNone(str)),
-    "post_formalin_fixation_time": OptionalNone(TypeValidatorNone(str)),
-    "tissue_block_size": OptionalNone(TypeValidatorNone(str)),
+    "formalin_fixation_time": OPTIONAL_STR_VALIDATOR,
+    "post_formalin_fixation_time": OPTIONAL_STR_VALIDATOR,
+    "tissue_block_size": OPTIONAL_STR_VALIDATOR,
     # This information is optional
-    "quantity": OptionalNone(TypeValidatorNone(str)),
-    "comment": OptionalNone(TypeValidatorNone(str)),
-    "age_at_sampling": OptionalNone(TypeValidatorNone(str)),
+    "quantity": OPTIONAL_STR_VALIDATOR,
+    "comment": OPTIONAL_STR_VALIDATOR,
+    "age_at_sampling": OPTIONAL_STR_VALIDATOR,
     "cohorts": OptionalNone(ListValidator(str, min_items=0)),
     "subject_id": OptionalNone(str),
     "synopsis": OptionalNone(str),
@@ -177,32 +216,32 @@ BALSAMIC_SAMPLE = {
 }
 
 MIP_RNA_SAMPLE = {
-    "internal_id": OptionalNone(TypeValidatorNone(str)),
+    "internal_id": OPTIONAL_STR_VALIDATOR,
     # "required for new samples"
-    "name": validators.RegexValidator(NAME_PATTERN),
+    "name": NAME_VALIDATOR,
     # customer
     "data_analysis": str,
-    "data_delivery": OptionalNone(TypeValidatorNone(str)),
+    "data_delivery": OPTIONAL_STR_VALIDATOR,
     "application": str,
-    "family_name": validators.RegexValidator(NAME_PATTERN),
-    "case_internal_id": OptionalNone(TypeValidatorNone(str)),
-    "sex": OptionalNone(validators.Any(SEX_OPTIONS)),
-    "source": OptionalNone(TypeValidatorNone(str)),
-    "priority": OptionalNone(validators.Any(PRIORITY_OPTIONS)),
-    "volume": OptionalNone(TypeValidatorNone(str)),
-    "container": OptionalNone(validators.Any(CONTAINER_OPTIONS)),
+    "family_name": NAME_VALIDATOR,
+    "case_internal_id": OPTIONAL_STR_VALIDATOR,
+    "sex": OptionalNone(OptionsValidator(SEX_OPTIONS)),
+    "source": OPTIONAL_STR_VALIDATOR,
+    "priority": OptionalNone(OptionsValidator(PRIORITY_OPTIONS)),
+    "volume": OPTIONAL_STR_VALIDATOR,
+    "container": OptionalNone(OptionsValidator(CONTAINER_OPTIONS)),
     # "required if plate for new samples"
-    "container_name": OptionalNone(TypeValidatorNone(str)),
-    "well_position": OptionalNone(TypeValidatorNone(str)),
-    "formalin_fixation_time": OptionalNone(TypeValidatorNone(str)),
-    "post_formalin_fixation_time": OptionalNone(TypeValidatorNone(str)),
-    "tissue_block_size": OptionalNone(TypeValidatorNone(str)),
+    "container_name": OPTIONAL_STR_VALIDATOR,
+    "well_position": OPTIONAL_STR_VALIDATOR,
+    "formalin_fixation_time": OPTIONAL_STR_VALIDATOR,
+    "post_formalin_fixation_time": OPTIONAL_STR_VALIDATOR,
+    "tissue_block_size": OPTIONAL_STR_VALIDATOR,
     # # "Not Required"
-    "quantity": OptionalNone(TypeValidatorNone(str)),
-    "comment": OptionalNone(TypeValidatorNone(str)),
-    "from_sample": OptionalNone(validators.RegexValidator(NAME_PATTERN)),
-    "time_point": OptionalNone(TypeValidatorNone(str)),
-    "age_at_sampling": OptionalNone(TypeValidatorNone(str)),
+    "quantity": OPTIONAL_STR_VALIDATOR,
+    "comment": OPTIONAL_STR_VALIDATOR,
+    "from_sample": OptionalNone(NAME_VALIDATOR),
+    "time_point": OPTIONAL_STR_VALIDATOR,
+    "age_at_sampling": OPTIONAL_STR_VALIDATOR,
     "cohorts": OptionalNone(ListValidator(str, min_items=0)),
     "subject_id": OptionalNone(str),
     "synopsis": OptionalNone(str),
@@ -213,56 +252,56 @@ MIP_RNA_SAMPLE = {
 EXTERNAL_SAMPLE = {
     # Orderform 1541
     # Order portal specific
-    "internal_id": OptionalNone(TypeValidatorNone(str)),
+    "internal_id": OPTIONAL_STR_VALIDATOR,
     "data_analysis": str,
-    "data_delivery": OptionalNone(TypeValidatorNone(str)),
+    "data_delivery": OPTIONAL_STR_VALIDATOR,
     # "required for new samples"
-    "name": validators.RegexValidator(NAME_PATTERN),
-    "capture_kit": OptionalNone(TypeValidatorNone(str)),
+    "name": NAME_VALIDATOR,
+    "capture_kit": OPTIONAL_STR_VALIDATOR,
     "application": str,
-    "sex": OptionalNone(validators.Any(SEX_OPTIONS)),
-    "family_name": validators.RegexValidator(NAME_PATTERN),
-    "case_internal_id": OptionalNone(TypeValidatorNone(str)),
-    "priority": OptionalNone(validators.Any(PRIORITY_OPTIONS)),
-    "source": OptionalNone(TypeValidatorNone(str)),
+    "sex": OptionalNone(OptionsValidator(SEX_OPTIONS)),
+    "family_name": NAME_VALIDATOR,
+    "case_internal_id": OPTIONAL_STR_VALIDATOR,
+    "priority": OptionalNone(OptionsValidator(PRIORITY_OPTIONS)),
+    "source": OPTIONAL_STR_VALIDATOR,
     # "Required if data analysis in Scout"
     "panels": ListValidator(str, min_items=0),
-    "status": OptionalNone(validators.Any(STATUS_OPTIONS)),
+    "status": OptionalNone(OptionsValidator(STATUS_OPTIONS)),
     # "Required if samples are part of trio/family"
-    "mother": OptionalNone(RegexValidatorNone(NAME_PATTERN)),
-    "father": OptionalNone(RegexValidatorNone(NAME_PATTERN)),
+    "mother": OPTIONAL_NAME_VALIDATOR,
+    "father": OPTIONAL_NAME_VALIDATOR,
     # "Not Required"
     "tumour": OptionalNone(bool, False),
-    "extraction_method": OptionalNone(TypeValidatorNone(str)),
-    "comment": OptionalNone(TypeValidatorNone(str)),
+    "extraction_method": OPTIONAL_STR_VALIDATOR,
+    "comment": OPTIONAL_STR_VALIDATOR,
 }
 
 FASTQ_SAMPLE = {
     # Orderform 1508
     # "required"
-    "name": validators.RegexValidator(NAME_PATTERN),
-    "container": OptionalNone(validators.Any(CONTAINER_OPTIONS)),
+    "name": NAME_VALIDATOR,
+    "container": OptionalNone(OptionsValidator(CONTAINER_OPTIONS)),
     "data_analysis": str,
-    "data_delivery": OptionalNone(TypeValidatorNone(str)),
+    "data_delivery": OPTIONAL_STR_VALIDATOR,
     "application": str,
-    "sex": OptionalNone(validators.Any(SEX_OPTIONS)),
+    "sex": OptionalNone(OptionsValidator(SEX_OPTIONS)),
     "volume": str,
     "source": str,
     "tumour": bool,
-    "priority": OptionalNone(validators.Any(PRIORITY_OPTIONS)),
+    "priority": OptionalNone(OptionsValidator(PRIORITY_OPTIONS)),
     # "required if plate"
-    "container_name": OptionalNone(TypeValidatorNone(str)),
-    "well_position": OptionalNone(TypeValidatorNone(str)),
+    "container_name": OPTIONAL_STR_VALIDATOR,
+    "well_position": OPTIONAL_STR_VALIDATOR,
     # "Required if data analysis in Scout or vcf delivery" => not valid for fastq
     # 'panels': ListValidator(str, min_items=1),
-    # 'status': OptionalNone(validators.Any(STATUS_OPTIONS),
+    # 'status': OptionalNone(OptionsValidator(STATUS_OPTIONS)),
     "elution_buffer": str,
     # "Required if samples are part of trio/family"
-    "mother": OptionalNone(RegexValidatorNone(NAME_PATTERN)),
-    "father": OptionalNone(RegexValidatorNone(NAME_PATTERN)),
+    "mother": OPTIONAL_NAME_VALIDATOR,
+    "father": OPTIONAL_NAME_VALIDATOR,
     # "Not Required"
-    "quantity": OptionalNone(TypeValidatorNone(str)),
-    "comment": OptionalNone(TypeValidatorNone(str)),
+    "quantity": OPTIONAL_STR_VALIDATOR,
+    "comment": OPTIONAL_STR_VALIDATOR,
 }
 
 RML_SAMPLE = {
@@ -270,73 +309,73 @@ RML_SAMPLE = {
     # Order portal specific
     "priority": str,
     # "This information is required"
-    "name": validators.RegexValidator(NAME_PATTERN),
+    "name": NAME_VALIDATOR,
     "pool": str,
     "application": str,
     "data_analysis": str,
-    "data_delivery": OptionalNone(TypeValidatorNone(str)),
+    "data_delivery": OPTIONAL_STR_VALIDATOR,
     "volume": str,
     "concentration": str,
-    "concentration_sample": OptionalNone(TypeValidatorNone(str)),
+    "concentration_sample": OPTIONAL_STR_VALIDATOR,
     "index": str,
-    "index_number": OptionalNone(TypeValidatorNone(str)),  # optional for NoIndex
+    "index_number": OPTIONAL_STR_VALIDATOR,  # optional for NoIndex
     # "Required if Plate"
-    "rml_plate_name": OptionalNone(TypeValidatorNone(str)),
-    "well_position_rml": OptionalNone(TypeValidatorNone(str)),
+    "rml_plate_name": OPTIONAL_STR_VALIDATOR,
+    "well_position_rml": OPTIONAL_STR_VALIDATOR,
     # "Automatically generated (if not custom) or custom"
-    "index_sequence": OptionalNone(TypeValidatorNone(str)),
+    "index_sequence": OPTIONAL_STR_VALIDATOR,
     # "Not required"
-    "comment": OptionalNone(TypeValidatorNone(str)),
-    "control": OptionalNone(TypeValidatorNone(str)),
+    "comment": OPTIONAL_STR_VALIDATOR,
+    "control": OPTIONAL_STR_VALIDATOR,
 }
 
 MICROSALT_SAMPLE = {
     # 1603 Orderform Microbial WGS
     # "These fields are required"
-    "name": validators.RegexValidator(NAME_PATTERN),
+    "name": NAME_VALIDATOR,
     "organism": str,
     "reference_genome": str,
     "data_analysis": str,
     "data_delivery": str,
     "application": str,
-    "priority": validators.Any(PRIORITY_OPTIONS),
+    "priority": OptionsValidator(PRIORITY_OPTIONS),
     "require_qcok": bool,
     "elution_buffer": str,
     "extraction_method": str,
     "volume": str,
-    "container": validators.Any(CONTAINER_OPTIONS),
+    "container": OptionsValidator(CONTAINER_OPTIONS),
     # "Required if Plate"
-    "container_name": OptionalNone(TypeValidatorNone(str)),
-    "well_position": OptionalNone(TypeValidatorNone(str)),
+    "container_name": OPTIONAL_STR_VALIDATOR,
+    "well_position": OPTIONAL_STR_VALIDATOR,
     # "Required if "Other" is chosen in column "Species""
-    "organism_other": OptionalNone(TypeValidatorNone(str)),
+    "organism_other": OPTIONAL_STR_VALIDATOR,
     # "These fields are not required"
-    "concentration_sample": OptionalNone(TypeValidatorNone(str)),
-    "quantity": OptionalNone(TypeValidatorNone(str)),
-    "comment": OptionalNone(TypeValidatorNone(str)),
+    "concentration_sample": OPTIONAL_STR_VALIDATOR,
+    "quantity": OPTIONAL_STR_VALIDATOR,
+    "comment": OPTIONAL_STR_VALIDATOR,
 }
 
 METAGENOME_SAMPLE = {
     # 1605 Orderform Microbial Metagenomes- 16S
     # "This information is required"
-    "name": validators.RegexValidator(NAME_PATTERN),
-    "container": OptionalNone(validators.Any(CONTAINER_OPTIONS)),
+    "name": NAME_VALIDATOR,
+    "container": OptionalNone(OptionsValidator(CONTAINER_OPTIONS)),
     "data_analysis": str,
-    "data_delivery": OptionalNone(TypeValidatorNone(str)),
+    "data_delivery": OPTIONAL_STR_VALIDATOR,
     "application": str,
     "require_qcok": bool,
     "elution_buffer": str,
     "source": str,
     "volume": str,
-    "priority": OptionalNone(validators.Any(PRIORITY_OPTIONS)),
+    "priority": OptionalNone(OptionsValidator(PRIORITY_OPTIONS)),
     # "Required if Plate"
-    "container_name": OptionalNone(TypeValidatorNone(str)),
-    "well_position": OptionalNone(TypeValidatorNone(str)),
+    "container_name": OPTIONAL_STR_VALIDATOR,
+    "well_position": OPTIONAL_STR_VALIDATOR,
     # "This information is not required"
-    "concentration_sample": OptionalNone(TypeValidatorNone(str)),
-    "quantity": OptionalNone(TypeValidatorNone(str)),
-    "extraction_method": OptionalNone(TypeValidatorNone(str)),
-    "comment": OptionalNone(TypeValidatorNone(str)),
+    "concentration_sample": OPTIONAL_STR_VALIDATOR,
+    "quantity": OPTIONAL_STR_VALIDATOR,
+    "extraction_method": OPTIONAL_STR_VALIDATOR,
+    "comment": OPTIONAL_STR_VALIDATOR,
 }
 
 SARSCOV2_SAMPLE = {
@@ -344,18 +383,18 @@ SARSCOV2_SAMPLE = {
     # "These fields are required"
     "application": str,
     "collection_date": str,
-    "container": validators.Any(CONTAINER_OPTIONS),
+    "container": OptionsValidator(CONTAINER_OPTIONS),
     "data_analysis": str,
     "data_delivery": str,
     "elution_buffer": str,
     "extraction_method": str,
     "lab_code": str,
-    "name": validators.RegexValidator(NAME_PATTERN),
+    "name": NAME_VALIDATOR,
     "organism": str,
     "original_lab": str,
     "original_lab_address": str,
     "pre_processing_method": str,
-    "priority": validators.Any(PRIORITY_OPTIONS),
+    "priority": OptionsValidator(PRIORITY_OPTIONS),
     "reference_genome": str,
     "region": str,
     "region_code": str,
@@ -363,37 +402,40 @@ SARSCOV2_SAMPLE = {
     "selection_criteria": str,
     "volume": str,
     # "Required if Plate"
-    "container_name": OptionalNone(TypeValidatorNone(str)),
-    "well_position": OptionalNone(TypeValidatorNone(str)),
+    "container_name": OPTIONAL_STR_VALIDATOR,
+    "well_position": OPTIONAL_STR_VALIDATOR,
     # "Required if "Other" is chosen in column "Species""
-    "organism_other": OptionalNone(TypeValidatorNone(str)),
+    "organism_other": OPTIONAL_STR_VALIDATOR,
     # "These fields are not required"
-    "comment": OptionalNone(TypeValidatorNone(str)),
-    "concentration_sample": OptionalNone(TypeValidatorNone(str)),
-    "quantity": OptionalNone(TypeValidatorNone(str)),
+    "comment": OPTIONAL_STR_VALIDATOR,
+    "concentration_sample": OPTIONAL_STR_VALIDATOR,
+    "quantity": OPTIONAL_STR_VALIDATOR,
 }
 
-ORDER_SCHEMES = {
-    OrderType.EXTERNAL: Scheme(
-        {**BASE_PROJECT, "samples": ListValidator(EXTERNAL_SAMPLE, min_items=1)}
-    ),
-    OrderType.MIP_DNA: Scheme({**BASE_PROJECT, "samples": ListValidator(MIP_SAMPLE, min_items=1)}),
-    OrderType.BALSAMIC: Scheme(
-        {**BASE_PROJECT, "samples": ListValidator(BALSAMIC_SAMPLE, min_items=1)}
-    ),
-    OrderType.MIP_RNA: Scheme(
-        {**BASE_PROJECT, "samples": ListValidator(MIP_RNA_SAMPLE, min_items=1)}
-    ),
-    OrderType.FASTQ: Scheme({**BASE_PROJECT, "samples": ListValidator(FASTQ_SAMPLE, min_items=1)}),
-    OrderType.RML: Scheme({**BASE_PROJECT, "samples": ListValidator(RML_SAMPLE, min_items=1)}),
-    OrderType.FLUFFY: Scheme({**BASE_PROJECT, "samples": ListValidator(RML_SAMPLE, min_items=1)}),
-    OrderType.MICROSALT: Scheme(
-        {**BASE_PROJECT, "samples": ListValidator(MICROSALT_SAMPLE, min_items=1)}
-    ),
-    OrderType.METAGENOME: Scheme(
-        {**BASE_PROJECT, "samples": ListValidator(METAGENOME_SAMPLE, min_items=1)}
-    ),
-    OrderType.SARS_COV_2: Scheme(
-        {**BASE_PROJECT, "samples": ListValidator(SARSCOV2_SAMPLE, min_items=1)}
-    ),
+ORDER_SAMPLE_SCHEMES = {
+    OrderType.EXTERNAL: EXTERNAL_SAMPLE,
+    OrderType.MIP_DNA: MIP_SAMPLE,
+    OrderType.BALSAMIC: BALSAMIC_SAMPLE,
+    OrderType.MIP_RNA: MIP_RNA_SAMPLE,
+    OrderType.FASTQ: FASTQ_SAMPLE,
+    OrderType.RML: RML_SAMPLE,
+    OrderType.MICROSALT: MICROSALT_SAMPLE,
+    OrderType.METAGENOME: METAGENOME_SAMPLE,
+    OrderType.SARS_COV_2: SARSCOV2_SAMPLE,
 }
+
+# Fluffy orders are validated with the RML scheme
+SHARED_ORDER_SCHEMES = {OrderType.FLUFFY: OrderType.RML}
+
+
+def get_order_scheme(order_type: OrderType) -> Scheme:
+    """Return the scheme for an order type, built the first time the order type is validated"""
+    return _build_order_scheme(SHARED_ORDER_SCHEMES.get(order_type, order_type))
+
+
+@lru_cache(maxsize=None)
+def _build_order_scheme(order_type: OrderType) -> Scheme:
+    """Build the scheme for the samples of an order type"""
+    return Scheme(
+        {**BASE_PROJECT, "samples": ListValidator(ORDER_SAMPLE_SCHEMES[order_type], min_items=1)}
+    )
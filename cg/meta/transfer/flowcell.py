@@ -124,8 +124,7 @@ class TransferFlowcell:
 
     def _sample_sheet_path(self, flowcell: str) -> str:
         """Construct the path to the samplesheet to be stored"""
-        run_name: str = self.stats.run_name(flowcell)
-        document_path: str = self.stats.document_path(flowcell)
+        document_path, run_name = self.stats.flowcell_meta(flowcell)
         unaligned_dir: str = Path(document_path).name
         root_dir: Path = self.stats.root_dir
         return str(root_dir.joinpath(run_name, unaligned_dir, "SampleSheet.csv"))
@@ -19,15 +19,13 @@ class UploadVogueAPI:
 
     def load_genotype(self, days: int) -> None:
         """Loading genotype data from the genotype database into the trending database"""
-        samples = self.genotype_api.export_sample(days=days)
-        samples = json.loads(samples)
-        for sample_id, sample_dict in samples.items():
-            sample_dict["_id"] = sample_id
-            self.vogue_api.load_genotype_data(sample_dict)
+        self._load_genotype_samples(self.genotype_api.export_sample(days=days))
+        self._load_genotype_samples(self.genotype_api.export_sample_analysis(days=days))
 
-        samples_analysis = self.genotype_api.export_sample_analysis(days=days)
-        samples_analysis = json.loads(samples_analysis)
-        for sample_id, sample_dict in samples_analysis.items():
+    def _load_genotype_samples(self, samples_export: str) -> None:
+        """Load the samples of one genotype export, so it can be freed before the next export"""
+        samples: dict = json.loads(samples_export)
+        for sample_id, sample_dict in samples.items():
             sample_dict["_id"] = sample_id
             self.vogue_api.load_genotype_data(sample_dict)
 
@@ -17,6 +17,8 @@ from housekeeper.store.models import Bundle, Version
 
 LOG = logging.getLogger(__name__)
 
+APPLICATION_TYPES = frozenset(["wgs", "wes", "tgs"])
+
 
 class AnalysisAPI(MetaAPI):
     """
@@ -135,13 +137,11 @@ class AnalysisAPI(MetaAPI):
         Gets application type for sample. Only application types supported by trailblazer (or other)
         are valid outputs
         """
-        analysis_type: str = sample_obj.application_version.application.prep_category
-        if analysis_type and analysis_type.lower() in [
-            "wgs",
-            "wes",
-            "tgs",
-        ]:
-            return analysis_type.lower()
+        analysis_type: str = (
+            sample_obj.application_version.application.prep_category or ""
+        ).lower()
+        if analysis_type in APPLICATION_TYPES:
+            return analysis_type
         return "other"
 
     def upload_bundle_housekeeper(self, case_id: str) -> None:
@@ -273,6 +273,8 @@ class AnalysisAPI(MetaAPI):
         sorted_files = sorted(files, key=lambda k: k["path"])
         fastq_dir = self.get_sample_fastq_destination_dir(case_obj=case_obj, sample_obj=sample_obj)
         fastq_dir.mkdir(parents=True, exist_ok=True)
+        # The naming metadata is the same for all files of a sample
+        naming_metadata: Optional[str] = self.get_additional_naming_metadata(sample_obj)
 
         for fastq_data in sorted_files:
             fastq_path = Path(fastq_data["path"])
@@ -282,7 +284,7 @@ class AnalysisAPI(MetaAPI):
                 sample=sample_obj.internal_id,
                 read=fastq_data["read"],
                 undetermined=fastq_data["undetermined"],
-                meta=self.get_additional_naming_metadata(sample_obj),
+                meta=naming_metadata,
             )
             destination_path: Path = fastq_dir / fastq_name
             linked_reads_paths[fastq_data["read"]].append(destination_path)
@@ -116,7 +116,8 @@ class MutantAnalysisAPI(AnalysisAPI):
             LOG.info("Dry-run, would have created config at path %s, with content:", config_path)
             LOG.info(case_config_list)
         config_path.parent.mkdir(parents=True, exist_ok=True)
-        json.dump(case_config_list, open(config_path, "w"), indent=4)
+        # Serialize the config in memory and write it with one call, which also closes the file
+        config_path.write_text(json.dumps(case_config_list, indent=4))
         LOG.info("Saved config to %s", config_path)
 
     def get_additional_naming_metadata(self, sample_obj: models.Sample) -> Optional[str]:
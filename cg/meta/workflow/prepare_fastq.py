@@ -2,7 +2,7 @@
 
 import logging
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Set
 
 from cg.apps.crunchy import CrunchyAPI
 from cg.apps.housekeeper.hk import HousekeeperAPI
@@ -55,9 +55,12 @@ class PrepareFastqAPI:
     def can_at_least_one_sample_be_decompressed(self, case_id: str) -> bool:
         """Returns True if at least one sample can be decompressed, otherwise False"""
         compression_objects: List[CompressionData] = self.get_compression_objects(case_id=case_id)
+        existing_file_names: List[Set[str]] = self.crunchy_api.get_existing_file_names(
+            compression_objects
+        )
         return any(
-            self.crunchy_api.is_spring_decompression_possible(compression_object)
-            for compression_object in compression_objects
+            self.crunchy_api.is_spring_decompression_possible(compression_object, file_names)
+            for compression_object, file_names in zip(compression_objects, existing_file_names)
         )
 
     def check_fastq_links(self, case_id: str) -> None:
@@ -14,28 +14,34 @@ PENDING_PATH_SUFFIX = ".crunchy.pending.txt"
 class CompressionData:
     """Holds information about compression data"""
 
-    def __init__(self, stub: Path = None):
+    def __init__(self, stub: Path):
         """Initialise a compression data object
 
         The stub is first part of the file name
         """
         self.stub = stub
         self.stub_string = str(self.stub)
+        # The file paths are checked over and over, build them once
+        self._pending_path: Path = self.stub.with_suffix(PENDING_PATH_SUFFIX)
+        self._spring_path: Path = self.stub.with_suffix(SPRING_SUFFIX)
+        self._spring_metadata_path: Path = self.stub.with_suffix(".json")
+        self._fastq_first: Path = Path(self.stub_string + FASTQ_FIRST_READ_SUFFIX)
+        self._fastq_second: Path = Path(self.stub_string + FASTQ_SECOND_READ_SUFFIX)
 
     @property
     def pending_path(self) -> Path:
         """Return the path to a compression pending file"""
-        return self.stub.with_suffix(PENDING_PATH_SUFFIX)
+        return self._pending_path
 
     @property
     def spring_path(self) -> Path:
         """Return the path to a SPRING file"""
-        return self.stub.with_suffix(SPRING_SUFFIX)
+        return self._spring_path
 
     @property
     def spring_metadata_path(self) -> Path:
         """Return the path to a SPRING metadata file"""
-        return self.stub.with_suffix(".json")
+        return self._spring_metadata_path
 
     @property
     def analysis_dir(self) -> Path:
@@ -45,12 +51,12 @@ class CompressionData:
     @property
     def fastq_first(self) -> Path:
         """Return the path to the first read in pair"""
-        return Path(self.stub_string + FASTQ_FIRST_READ_SUFFIX)
+        return self._fastq_first
 
     @property
     def fastq_second(self) -> Path:
         """Return the path to the second read in pair"""
-        return Path(self.stub_string + FASTQ_SECOND_READ_SUFFIX)
+        return self._fastq_second
 
     @property
     def run_name(self) -> str:
@@ -59,7 +65,7 @@ class CompressionData:
 
     def pair_exists(self) -> bool:
         """Check that both files in FASTQ pair exists"""
-        LOG.info("Check if FASTQ pair exists")
+        LOG.debug("Check if FASTQ pair exists")
         if not self.file_exists_and_is_accesible(self.fastq_first):
             return False
         return bool(self.file_exists_and_is_accesible(self.fastq_second))
@@ -87,13 +93,13 @@ class CompressionData:
     @staticmethod
     def get_nlinks(file_path: Path) -> int:
         """Get number of links to path"""
-        LOG.info("Check nr of links for %s", file_path)
+        LOG.debug("Check nr of links for %s", file_path)
         return os.stat(file_path).st_nlink
 
     @staticmethod
     def is_symlink(file_path: Path) -> bool:
         """Check if file path is symbolik link"""
-        LOG.info("Check if %s is a symlink", file_path)
+        LOG.debug("Check if %s is a symlink", file_path)
         return os.path.islink(file_path)
 
     @staticmethod
@@ -105,17 +111,17 @@ class CompressionData:
 
     def spring_exists(self) -> bool:
         """Check if the SPRING file exists"""
-        LOG.info("Check if SPRING archive file exists")
+        LOG.debug("Check if SPRING archive file exists")
         return self.file_exists_and_is_accesible(self.spring_path)
 
     def metadata_exists(self) -> bool:
         """Check if the SPRING metadata file exists"""
-        LOG.info("Check if SPRING metadata file exists")
+        LOG.debug("Check if SPRING metadata file exists")
         return self.file_exists_and_is_accesible(self.spring_metadata_path)
 
     def pending_exists(self) -> bool:
         """Check if the SPRING pending flag file exists"""
-        LOG.info("Check if pending compression file exists")
+        LOG.debug("Check if pending compression file exists")
         return self.file_exists_and_is_accesible(self.pending_path)
 
     def __str__(self):
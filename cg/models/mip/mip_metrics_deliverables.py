@@ -1,15 +1,24 @@
-from typing import List, Optional, Any
+from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, validator, Field
+from pydantic import BaseModel, Field, root_validator, validator
 
 from cg.constants.gender import Gender
 
 
-def _get_metric_per_sample_id(sample_id: str, metric_objs: list) -> Any:
-    """Get metric for a sample_id from metric object"""
+def _get_metric_per_sample_id_map(metric_objs: list) -> Dict[str, Any]:
+    """Map each sample_id to the value of its first metric in metric objects"""
+    metric_per_sample_id: Dict[str, Any] = {}
     for metric in metric_objs:
-        if sample_id == metric.sample_id:
-            return metric.value
+        metric_per_sample_id.setdefault(metric.sample_id, metric.value)
+    return metric_per_sample_id
+
+
+def _get_metrics_by_name(raw_metrics: list) -> Dict[str, list]:
+    """Group all metrics by their name in one pass"""
+    metrics_by_name: Dict[str, list] = {}
+    for metric in raw_metrics:
+        metrics_by_name.setdefault(metric.name, []).append(metric)
+    return metrics_by_name
 
 
 class MetricsBase(BaseModel):
@@ -66,6 +75,25 @@ class MeanInsertSize(BaseModel):
         return int(value)
 
 
+def _get_mapped_reads(
+    sample_ids: set, metrics_by_name: Dict[str, List[MetricsBase]]
+) -> List[MappedReads]:
+    """Get the fraction of mapped reads per sample from the metrics grouped by name"""
+    mapped_reads: List = []
+    total_sequences: dict = {}
+    reads_mapped: dict = {}
+    for metric in metrics_by_name.get("raw_total_sequences", []):
+        raw_total_sequences = total_sequences.get(metric.id, 0)
+        total_sequences[metric.id] = int(metric.value) + raw_total_sequences
+    for metric in metrics_by_name.get("reads_mapped", []):
+        raw_reads_mapped = reads_mapped.get(metric.id, 0)
+        reads_mapped[metric.id] = int(metric.value) + raw_reads_mapped
+    for sample_id in sample_ids:
+        fraction_mapped_read = reads_mapped[sample_id] / total_sequences[sample_id]
+        mapped_reads.append(MappedReads(sample_id=sample_id, value=fraction_mapped_read))
+    return mapped_reads
+
+
 class ParsedMetrics(BaseModel):
     """Defines parsed metrics"""
 
@@ -90,84 +118,59 @@ class MetricsDeliverables(BaseModel):
     @validator("sample_ids", always=True)
     def set_sample_ids(cls, _, values: dict) -> set:
         """Set sample_ids gathered from all metrics"""
-        sample_ids: List = []
-        raw_metrics: List = values.get("metrics_")
-        for metric in raw_metrics:
-            sample_ids.append(metric.id)
-        return set(sample_ids)
-
-    @validator("duplicate_reads", always=True)
-    def set_duplicate_reads(cls, _, values: dict) -> List[DuplicateReads]:
-        """Set duplicate_reads"""
-        duplicate_reads: List = []
         raw_metrics: List = values.get("metrics_")
-        for metric in raw_metrics:
-            if metric.name == "fraction_duplicates":
-                duplicate_reads.append(DuplicateReads(sample_id=metric.id, value=metric.value))
-        return duplicate_reads
-
-    @validator("mapped_reads", always=True)
-    def set_mapped_reads(cls, _, values: dict) -> List[MappedReads]:
-        """Set mapped reads"""
-        sample_ids: set = values.get("sample_ids")
-        mapped_reads: List = []
-        total_sequences: dict = {}
-        reads_mapped: dict = {}
-        raw_metrics: List = values.get("metrics_")
-        for metric in raw_metrics:
-            if metric.name == "raw_total_sequences":
-                raw_total_sequences = total_sequences.get(metric.id, 0)
-                total_sequences[metric.id] = int(metric.value) + raw_total_sequences
-            if metric.name == "reads_mapped":
-                raw_reads_mapped = reads_mapped.get(metric.id, 0)
-                reads_mapped[metric.id] = int(metric.value) + raw_reads_mapped
-        for sample_id in sample_ids:
-            fraction_mapped_read = reads_mapped[sample_id] / total_sequences[sample_id]
-            mapped_reads.append(MappedReads(sample_id=sample_id, value=fraction_mapped_read))
-        return mapped_reads
-
-    @validator("mean_insert_size", always=True)
-    def set_mean_insert_size(cls, _, values: dict) -> List[MeanInsertSize]:
-        """Set mean insert size"""
-        mean_insert_size: List = []
-        raw_metrics: List = values.get("metrics_")
-        for metric in raw_metrics:
-            if metric.name == "MEAN_INSERT_SIZE":
-                mean_insert_size.append(MeanInsertSize(sample_id=metric.id, value=metric.value))
-        return mean_insert_size
-
-    @validator("predicted_sex", always=True)
-    def set_predicted_sex(cls, _, values: dict) -> List[GenderCheck]:
-        """Set predicted sex"""
-        predicted_sex: List = []
-        raw_metrics: List = values.get("metrics_")
-        for metric in raw_metrics:
-            if metric.name == "gender":
-                predicted_sex.append(GenderCheck(sample_id=metric.id, value=metric.value))
-        return predicted_sex
-
-    @validator("sample_id_metrics", always=True)
-    def set_sample_id_metrics(cls, _, values: dict) -> List[ParsedMetrics]:
+        return {metric.id for metric in raw_metrics}
+
+    @root_validator(skip_on_failure=True)
+    def set_metrics(cls, values: dict) -> dict:
+        """Set duplicate reads, mapped reads, mean insert size and predicted sex
+
+        The metrics are grouped by name once and each kind of metric is read from its own group
+        """
+        metrics_by_name: Dict[str, List[MetricsBase]] = _get_metrics_by_name(
+            raw_metrics=values.get("metrics_")
+        )
+        values["duplicate_reads"] = [
+            DuplicateReads(sample_id=metric.id, value=metric.value)
+            for metric in metrics_by_name.get("fraction_duplicates", [])
+        ]
+        values["mapped_reads"] = _get_mapped_reads(
+            sample_ids=values.get("sample_ids"), metrics_by_name=metrics_by_name
+        )
+        values["mean_insert_size"] = [
+            MeanInsertSize(sample_id=metric.id, value=metric.value)
+            for metric in metrics_by_name.get("MEAN_INSERT_SIZE", [])
+        ]
+        values["predicted_sex"] = [
+            GenderCheck(sample_id=metric.id, value=metric.value)
+            for metric in metrics_by_name.get("gender", [])
+        ]
+        return values
+
+    @root_validator(skip_on_failure=True)
+    def set_sample_id_metrics(cls, values: dict) -> dict:
         """Set parsed sample_id metrics gathered from all metrics"""
         sample_ids: set = values.get("sample_ids")
         sample_id_metrics: list = []
-        metric_per_sample_id_map: dict = {
-            "duplicate_reads": values.get("duplicate_reads"),
-            "mapped_reads": values.get("mapped_reads"),
-            "mean_insert_size": values.get("mean_insert_size"),
-            "predicted_sex": values.get("predicted_sex"),
+        metric_per_sample_id_map: Dict[str, Dict[str, Any]] = {
+            metric_name: _get_metric_per_sample_id_map(metric_objs=values.get(metric_name))
+            for metric_name in [
+                "duplicate_reads",
+                "mapped_reads",
+                "mean_insert_size",
+                "predicted_sex",
+            ]
         }
         for sample_id in sample_ids:
             metric_per_sample_id: dict = {}
             metric_per_sample_id["sample_id"] = sample_id
-            for metric_name, metric_objs in metric_per_sample_id_map.items():
-                metric_value: Any = _get_metric_per_sample_id(
-                    sample_id=sample_id, metric_objs=metric_objs
-                )
+            for metric_name, metric_values in metric_per_sample_id_map.items():
+                metric_value: Any = metric_values.get(sample_id)
                 if metric_value:
                     metric_per_sample_id[metric_name] = metric_value
             sample_id_metrics.append(ParsedMetrics(**metric_per_sample_id))
-        return sample_id_metrics
+        values["sample_id_metrics"] = sample_id_metrics
+        return values
 
 
 def get_sample_id_metric(sample_id_metrics: List[ParsedMetrics], sample_id: str) -> ParsedMetrics:
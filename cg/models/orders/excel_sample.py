@@ -1,9 +1,29 @@
-from typing import List, Optional
+import re
+from typing import List, Optional, Pattern
 from pydantic import Field, validator
 
 from cg.constants.orderforms import REV_SEX_MAP, SOURCE_TYPES
 from cg.models.orders.sample_base import OrderSample
 
+DATA_ANALYSIS_ALTERNATIVES = frozenset(
+    [
+        "custom",
+        "Balsamic",
+        "fastq",
+        "FLUFFY",
+        "MicroSALT",
+        "MIP DNA",
+        "MIP RNA",
+        "SARS-CoV-2",
+        "scout",
+        "No analysis",
+    ]
+)
+# Panels are separated by either ";" or ":", map both to ";" to split in one pass
+PANEL_SEPARATOR_TABLE: dict = str.maketrans({":": ";"})
+# Excel gives whole numbers as floats, e.g. "2.0", the trailing ".0" is dropped before matching
+NUMERIC_PATTERN: Pattern = re.compile(r"(\d+(?:\.\d+)??)(?:\.0)?")
+
 
 class ExcelSample(OrderSample):
     application: str = Field(..., alias="UDF/Sequencing Analysis")
@@ -59,20 +79,7 @@ class ExcelSample(OrderSample):
 
     @validator("data_analysis")
     def validate_data_analysis(cls, value):
-
-        data_analysis_alternatives = [
-            "custom",
-            "Balsamic",
-            "fastq",
-            "FLUFFY",
-            "MicroSALT",
-            "MIP DNA",
-            "MIP RNA",
-            "SARS-CoV-2",
-            "scout",
-            "No analysis",
-        ]
-        if value not in data_analysis_alternatives:
+        if value not in DATA_ANALYSIS_ALTERNATIVES:
             raise AttributeError(f"{value} is not a valid data analysis")
         return value
 
@@ -82,9 +89,9 @@ class ExcelSample(OrderSample):
     def numeric_value(cls, value: Optional[str]):
         if not value:
             return None
-        str_value = value.rsplit(".0")[0]
-        if str_value.replace(".", "").isnumeric():
-            return str_value
+        numeric_match = NUMERIC_PATTERN.fullmatch(value)
+        if numeric_match:
+            return numeric_match.group(1)
         raise AttributeError(f"Non numeric value {value}")
 
     @validator("mother", "father")
@@ -110,10 +117,7 @@ class ExcelSample(OrderSample):
     def parse_panels(cls, value):
         if not value:
             return None
-        separator = ";"
-        if ":" in value:
-            separator = ":"
-        return value.split(separator)
+        return value.translate(PANEL_SEPARATOR_TABLE).split(";")
 
     @validator("data_delivery")
     def validate_data_delivery(cls, value: Optional[str]):
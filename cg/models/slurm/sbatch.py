@@ -18,6 +18,7 @@ class Sbatch(BaseModel):
     exclude: Optional[str] = ""
     number_tasks: int
     memory: int
+    array_job: bool = False
 
 
 class SbatchDragen(BaseModel):
@@ -1,6 +1,6 @@
 """Handler to find basic data objects"""
 import datetime as dt
-from typing import List
+from typing import Dict, Iterable, List
 
 from sqlalchemy import desc
 
@@ -103,6 +103,16 @@ class FindBasicDataHandler(BaseHandler):
         """Returns all panels."""
         return self.Panel.query.order_by(models.Panel.abbrev)
 
+    def panels_by_abbrev(self, abbrevs: Iterable[str]) -> Dict[str, models.Panel]:
+        """Find the panels with the given abbreviations in one query."""
+        abbrevs = set(abbrevs)
+        if not abbrevs:
+            return {}
+        return {
+            panel_obj.abbrev: panel_obj
+            for panel_obj in self.Panel.query.filter(models.Panel.abbrev.in_(abbrevs))
+        }
+
     def user(self, email: str) -> models.User:
         """Fetch a user from the store."""
         return self.User.query.filter_by(email=email).first()
@@ -3,7 +3,7 @@ import datetime as dt
 from typing import List, Optional
 
 from sqlalchemy import and_, func, or_
-from sqlalchemy.orm import Query
+from sqlalchemy.orm import Query, joinedload
 
 from cg.store import models
 from cg.store.api.base import BaseHandler
@@ -139,6 +139,18 @@ class FindBusinessDataHandler(BaseHandler):
         """Fetch a family by internal id from the database."""
         return self.Family.query.filter_by(internal_id=internal_id).first()
 
+    def family_with_links(self, internal_id: str) -> models.Family:
+        """Fetch a family by internal id together with its links and their samples"""
+        return (
+            self.Family.query.options(
+                joinedload(models.Family.links).joinedload(models.FamilySample.sample),
+                joinedload(models.Family.links).joinedload(models.FamilySample.mother),
+                joinedload(models.Family.links).joinedload(models.FamilySample.father),
+            )
+            .filter_by(internal_id=internal_id)
+            .first()
+        )
+
     def family_samples(self, family_id: str) -> List[models.FamilySample]:
         """Find the samples of a family."""
         return (
@@ -272,6 +284,16 @@ class FindBusinessDataHandler(BaseHandler):
         """Fetch a sample by lims id."""
         return self.Sample.query.filter_by(internal_id=internal_id).first()
 
+    def sample_with_links(self, internal_id: str) -> models.Sample:
+        """Fetch a sample by lims id together with its links and their families"""
+        return (
+            self.Sample.query.options(
+                joinedload(models.Sample.links).joinedload(models.FamilySample.family)
+            )
+            .filter_by(internal_id=internal_id)
+            .first()
+        )
+
     def samples(
         self, *, customers: Optional[List[models.Customer]] = None, enquiry: str = None
     ) -> Query:
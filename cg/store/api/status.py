@@ -1,4 +1,5 @@
 from datetime import datetime, timedelta
+from itertools import islice
 from types import SimpleNamespace
 from typing import List, Optional, Tuple
 
@@ -67,7 +68,7 @@ class StatusHandler(BaseHandler):
         self, pipeline: Pipeline = None, threshold: bool = False, limit: int = None
     ) -> List[models.Family]:
         """Returns a list if cases ready to be analyzed or set to be reanalyzed"""
-        families_query = list(
+        families_query: Query = (
             self.Family.query.outerjoin(models.Analysis)
             .join(models.Family.links, models.FamilySample.sample)
             .filter(or_(models.Sample.is_external, models.Sample.sequenced_at.isnot(None)))
@@ -84,7 +85,8 @@ class StatusHandler(BaseHandler):
             )
             .order_by(models.Family.priority.desc(), models.Family.ordered_at)
         )
-        families_query = [
+        # Filter lazily so that the relationships of cases beyond the limit are never loaded
+        families = (
             case_obj
             for case_obj in families_query
             if case_obj.latest_sequenced
@@ -93,13 +95,11 @@ class StatusHandler(BaseHandler):
                 or not case_obj.latest_analyzed
                 or case_obj.latest_analyzed < case_obj.latest_sequenced
             )
-        ]
+        )
 
         if threshold:
-            families_query = [
-                case_obj for case_obj in families_query if case_obj.all_samples_pass_qc
-            ]
-        return families_query[:limit]
+            families = (case_obj for case_obj in families if case_obj.all_samples_pass_qc)
+        return list(islice(families, limit))
 
     def cases_to_store(self, pipeline: Pipeline, limit: int = None) -> list:
         """Returns a list of cases that may be available to store in Housekeeper"""
@@ -2,7 +2,6 @@
 Code to handle communications to the shell from CG
 """
 
-import copy
 import logging
 import subprocess
 from subprocess import CalledProcessError
@@ -58,9 +57,8 @@ class Process:
         Return(int): Return code from called process
 
         """
-        command = copy.deepcopy(self.base_call)
-        if parameters:
-            command.extend(parameters)
+        # The base call only holds strings, a shallow copy is enough
+        command = [*self.base_call, *(parameters or [])]
 
         LOG.info("Running command %s", " ".join(command))
         if dry_run:
@@ -1 +1,27 @@
 """Some helper functions for working with files"""
+import logging
+import os
+from pathlib import Path
+from typing import List, Set
+
+LOG = logging.getLogger(__name__)
+
+
+def get_dir_entries(directory: Path) -> List[os.DirEntry]:
+    """Return the entries of a directory, empty if the directory can not be listed
+
+    The entries know whether they are files or directories without another stat call
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return list(entries)
+    except FileNotFoundError:
+        LOG.info("%s does not exist", directory)
+    except PermissionError:
+        LOG.warning("Not permitted to access %s. Skipping", directory)
+    return []
+
+
+def get_dir_entry_names(directory: Path) -> Set[str]:
+    """Return the names of all entries in a directory, empty if the directory can not be listed"""
+    return {entry.name for entry in get_dir_entries(directory)}
@@ -0,0 +1,183 @@
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import event
+from sqlalchemy.orm.exc import NoResultFound
+
+from cg.apps.cgstats.db import models as stats_models
+from cg.apps.cgstats.stats import StatsAPI
+from cg.models.cgstats.flowcell import StatsFlowcell
+
+
+def test_flowcell_sample_reads(populated_stats_api: StatsAPI):
+    # GIVEN a cg stats api with a sample run on two lanes of a novaseq flowcell
+    flowcell: stats_models.Flowcell = populated_stats_api.Flowcell.query.first()
+    sample: stats_models.Sample = populated_stats_api.Sample.query.first()
+
+    # WHEN calculating the reads for the samples on the flowcell
+    sample_reads: list = populated_stats_api.flowcell_sample_reads(flowcell).all()
+
+    # THEN the reads of all lanes should be summed up per sample and flowcell
+    assert len(sample_reads) == 1
+    assert sample_reads[0].sample_id == sample.sample_id
+    assert sample_reads[0].name == flowcell.flowcellname
+    assert sample_reads[0].reads == sum(unaligned.readcounts for unaligned in sample.unaligned)
+
+
+def test_flowcell_sample_reads_low_q30(populated_stats_api: StatsAPI):
+    # GIVEN a cg stats api with a sample with a low q30 on a lane of a novaseq flowcell
+    flowcell: stats_models.Flowcell = populated_stats_api.Flowcell.query.first()
+    populated_stats_api.Unaligned.query.first().q30_bases_pct = 70
+    populated_stats_api.commit()
+
+    # WHEN calculating the reads for the samples on the flowcell
+    sample_reads: list = populated_stats_api.flowcell_sample_reads(flowcell).all()
+
+    # THEN the reads should not be counted
+    assert sample_reads[0].reads is None
+    assert sample_reads[0].q30 == 70
+
+
+def test_lane_sample_counts(populated_stats_api: StatsAPI):
+    # GIVEN a cg stats api with a flowcell where one sample is run on each lane
+    flowcell: stats_models.Flowcell = populated_stats_api.Flowcell.query.first()
+
+    # WHEN counting the samples per lane
+    lane_sample_counts: Dict[int, int] = populated_stats_api.lane_sample_counts(flowcell)
+
+    # THEN no lane should be pooled
+    assert lane_sample_counts
+    assert all(sample_count == 1 for sample_count in lane_sample_counts.values())
+
+
+def test_flowcell(populated_stats_api: StatsAPI):
+    # GIVEN a cg stats api with a flowcell
+    flowcell: stats_models.Flowcell = populated_stats_api.Flowcell.query.first()
+
+    # WHEN fetching the flowcell information
+    stats_flowcell: StatsFlowcell = populated_stats_api.flowcell(flowcell.flowcellname)
+
+    # THEN the samples with reads on the flowcell should be returned
+    assert stats_flowcell.name == flowcell.flowcellname
+    assert len(stats_flowcell.samples) == 1
+    assert stats_flowcell.samples[0].reads > 0
+    assert isinstance(stats_flowcell.samples[0].reads, int)
+
+
+def test_flowcell_without_date(populated_stats_api: StatsAPI):
+    # GIVEN a cg stats api with a flowcell that has no date
+    flowcell: stats_models.Flowcell = populated_stats_api.Flowcell.query.first()
+    flowcell.time = None
+    populated_stats_api.commit()
+
+    # WHEN fetching the flowcell information
+    with pytest.raises(ValidationError):
+        # THEN assert that the missing date is not accepted
+        populated_stats_api.flowcell(flowcell.flowcellname)
+
+
+def test_is_lane_pooled(populated_stats_api: StatsAPI):
+    # GIVEN a cg stats api with a flowcell where one sample is run on each lane
+    flowcell: stats_models.Flowcell = populated_stats_api.Flowcell.query.first()
+    lane: int = populated_stats_api.Unaligned.query.first().lane
+
+    # WHEN checking if the lane is pooled
+    is_pooled: bool = populated_stats_api.is_lane_pooled(flowcell_obj=flowcell, lane=lane)
+
+    # THEN the lane should not be pooled
+    assert is_pooled is False
+    # THEN the lane counts should be cached for the flowcell
+    assert flowcell.flowcell_id in populated_stats_api._lane_sample_counts
+
+
+def test_fastqs(stats_api: StatsAPI):
+    # GIVEN a cg stats api with a demultiplexed flowcell on disk
+    sample = stats_models.Sample(samplename="ADM1136A3")
+
+    # WHEN fetching the FASTQ files of a sample on the flowcell
+    fastqs: List[Path] = list(stats_api.fastqs(flowcell="HJKMYBCXX", sample_obj=sample))
+
+    # THEN all FASTQ files in the sample directory should be returned
+    assert len(fastqs) == 4
+    assert all(fastq.name.endswith(".fastq.gz") for fastq in fastqs)
+    assert all(fastq.parent.name.startswith("Sample_ADM1136A3_") for fastq in fastqs)
+
+
+def test_fastqs_other_sample(stats_api: StatsAPI):
+    # GIVEN a cg stats api with a demultiplexed flowcell on disk
+    sample = stats_models.Sample(samplename="ADM1136")
+
+    # WHEN fetching the FASTQ files of a sample that is not on the flowcell
+    fastqs: List[Path] = list(stats_api.fastqs(flowcell="HJKMYBCXX", sample_obj=sample))
+
+    # THEN no FASTQ files should be returned
+    assert fastqs == []
+
+
+def test_get_curated_sample_name():
+    # GIVEN a sample name with a suffix after the LIMS id
+    sample_name = "ADM1136A3B_XTC08"
+
+    # WHEN curating the sample name
+    curated_sample_name: str = StatsAPI.get_curated_sample_name(sample_name)
+
+    # THEN the suffix and trailing A/B should be removed
+    assert curated_sample_name == "ADM1136A3"
+
+
+def test_flowcell_meta(populated_stats_api: StatsAPI):
+    # GIVEN a cg stats api with a demultiplexed flowcell
+    flowcell: stats_models.Flowcell = populated_stats_api.Flowcell.query.first()
+    datasource: stats_models.Datasource = flowcell.demux[0].datasource
+
+    # WHEN fetching the document path and run name of the flowcell
+    document_path, run_name = populated_stats_api.flowcell_meta(flowcell.flowcellname)
+
+    # THEN the values of the latest support parameters and datasource should be returned
+    assert document_path == datasource.supportparams.document_path
+    assert run_name == datasource.runname
+    assert document_path == populated_stats_api.document_path(flowcell.flowcellname)
+    assert run_name == populated_stats_api.run_name(flowcell.flowcellname)
+
+
+def test_flowcell_meta_missing_flowcell(populated_stats_api: StatsAPI):
+    # GIVEN a cg stats api without a flowcell with the name
+    flowcell_name = "missing_flowcell"
+
+    # WHEN fetching the document path and run name of the flowcell
+    with pytest.raises(NoResultFound):
+        # THEN assert that the missing flowcell is not silently accepted
+        populated_stats_api.flowcell_meta(flowcell_name)
+
+
+def test_flowcell_no_lazy_loading(populated_stats_api: StatsAPI):
+    # GIVEN a cg stats api with a flowcell where nothing is loaded in the session
+    flowcell_name: str = populated_stats_api.Flowcell.query.first().flowcellname
+    populated_stats_api.session.expire_all()
+    statements: List[str] = []
+
+    def count_statement(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(populated_stats_api.engine, "before_cursor_execute", count_statement)
+
+    # WHEN fetching the flowcell information
+    populated_stats_api.flowcell(flowcell_name)
+    event.remove(populated_stats_api.engine, "before_cursor_execute", count_statement)
+
+    # THEN the flowcell, the lane counts and the samples with their reads should be fetched
+    # in one query each
+    assert len(statements) == 3
+
+
+def test_fastqs_missing_flowcell(stats_api: StatsAPI):
+    # GIVEN a cg stats api without any demultiplexed runs for a flowcell on disk
+    sample = stats_models.Sample(samplename="ADM1136A3")
+
+    # WHEN fetching the FASTQ files of a sample on the flowcell
+    fastqs: List[Path] = list(stats_api.fastqs(flowcell="HJKMYBCYY", sample_obj=sample))
+
+    # THEN no FASTQ files should be returned
+    assert fastqs == []
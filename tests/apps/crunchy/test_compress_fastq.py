@@ -114,6 +114,65 @@ def test_fastq_to_spring_sbatch(
     assert compression_object.pending_exists() is True
 
 
+def test_fastq_to_spring_batch(
+    crunchy_config_dict: dict,
+    compression_object: CompressionData,
+    sbatch_process: Process,
+    sbatch_job_number: int,
+    mocker,
+):
+    """Test compressing FASTQ files of several runs with one job array"""
+    # GIVEN a crunchy-api, and FASTQ paths
+    crunchy_api = CrunchyAPI(crunchy_config_dict)
+    crunchy_api.slurm_api.process = sbatch_process
+    spy_submit_sbatch = mocker.spy(crunchy_api.slurm_api, "submit_sbatch")
+    # GIVEN that the pending path does not exist
+    assert compression_object.pending_exists() is False
+
+    # WHEN calling fastq_to_spring_batch on the FASTQ files of one run
+    job_number: int = crunchy_api.fastq_to_spring_batch(
+        compression_objs=[compression_object], sample_id="sample"
+    )
+
+    # THEN assert that correct job number was returned
+    assert job_number == sbatch_job_number
+    # THEN assert that the pending path was created
+    assert compression_object.pending_exists() is True
+    # THEN assert that one job array with the files of the run was submitted
+    submitted: dict = spy_submit_sbatch.call_args[1]
+    assert submitted["array"] == "0-0"
+    assert f"FASTQ_FIRST=({compression_object.fastq_first})" in submitted["sbatch_content"]
+    assert "${SPRING_PATH[$SLURM_ARRAY_TASK_ID]}" in submitted["sbatch_content"]
+    # THEN assert that each array task writes its own log files
+    assert "_%A_%a.stderr" in submitted["sbatch_content"]
+
+
+def test_fastq_to_spring_batch_several_runs(
+    crunchy_config_dict: dict, sbatch_process: Process, tmp_path: Path, mocker
+):
+    """Test that a job array of several runs is named and logged for the whole batch"""
+    # GIVEN a crunchy-api and the FASTQ files of two runs in separate directories
+    crunchy_api = CrunchyAPI(crunchy_config_dict)
+    crunchy_api.slurm_api.process = sbatch_process
+    spy_submit_sbatch = mocker.spy(crunchy_api.slurm_api, "submit_sbatch")
+    compression_objs: List[CompressionData] = []
+    for run_name in ["run_1", "run_2"]:
+        run_dir: Path = tmp_path / run_name
+        run_dir.mkdir()
+        compression_objs.append(CompressionData(run_dir / run_name))
+
+    # WHEN compressing the FASTQ files of both runs with one job array
+    crunchy_api.fastq_to_spring_batch(compression_objs=compression_objs, sample_id="sample")
+
+    # THEN assert that the job is named after the whole batch
+    submitted: dict = spy_submit_sbatch.call_args[1]
+    assert "#SBATCH --job-name=sample_2_runs_fastq_to_spring\n" in submitted["sbatch_content"]
+    # THEN assert that the logs and the sbatch file go to the directory of the first run
+    log_dir: Path = tmp_path / "run_1"
+    assert f"--error={log_dir}/sample_2_runs_fastq_to_spring_%A_%a" in submitted["sbatch_content"]
+    assert submitted["sbatch_path"].parent == log_dir
+
+
 def test_spring_to_fastq(
     compression_object: CompressionData,
     spring_metadata_file: Path,
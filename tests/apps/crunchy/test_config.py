@@ -2,7 +2,11 @@
 import json
 from pathlib import Path
 
-from cg.apps.crunchy.files import get_crunchy_metadata, update_metadata_date
+from cg.apps.crunchy.files import (
+    get_crunchy_metadata,
+    load_crunchy_metadata,
+    update_metadata_date,
+)
 from cgmodels.crunchy.metadata import CrunchyMetadata
 
 
@@ -33,3 +37,34 @@ def test_update_date(spring_metadata_file: Path, crunchy_config_dict: dict):
     updated_spring_metadata: CrunchyMetadata = get_crunchy_metadata(spring_metadata_file)
     for file_info in updated_spring_metadata.files:
         assert file_info.updated is not None
+
+
+def test_load_crunchy_metadata_updated_file(spring_metadata_file: Path, crunchy_config_dict: dict):
+    """Test that loading the metadata again picks up an updated spring metadata file"""
+    # GIVEN a metadata file that has been loaded once
+    spring_metadata: CrunchyMetadata = load_crunchy_metadata(spring_metadata_file)
+
+    # WHEN loading the unchanged file again
+    # THEN assert that the loaded metadata is reused
+    assert load_crunchy_metadata(spring_metadata_file) is spring_metadata
+
+    # WHEN updating the date in the file
+    update_metadata_date(spring_metadata_file)
+
+    # THEN assert that the updated content is loaded
+    updated_spring_metadata: CrunchyMetadata = load_crunchy_metadata(spring_metadata_file)
+    for file_info in updated_spring_metadata.files:
+        assert file_info.updated is not None
+
+
+def test_update_date_loaded_metadata(spring_metadata_file: Path, crunchy_config_dict: dict):
+    """Test that updating the date does not change metadata that has already been loaded"""
+    # GIVEN a metadata file that has been loaded
+    spring_metadata: CrunchyMetadata = load_crunchy_metadata(spring_metadata_file)
+
+    # WHEN running the update date function
+    update_metadata_date(spring_metadata_file)
+
+    # THEN assert that the loaded metadata is unchanged
+    for file_info in spring_metadata.files:
+        assert file_info.updated is None
@@ -1,4 +1,5 @@
 """Tests for CrunchyAPI"""
+import datetime
 import json
 import logging
 from pathlib import Path
@@ -23,6 +24,10 @@ def test_get_tmp_path_correct_place(project_dir: Path):
     tmp_dir_path = Path(tmp_dir)
     # THEN assert the dir is in the correct place
     assert tmp_dir_path.parent == project_dir
+    # THEN assert the dir is left for the sbatch script to create
+    assert not tmp_dir_path.exists()
+    assert tmp_dir_path.name.startswith(prefix)
+    assert tmp_dir_path.name.endswith(suffix)
 
 
 def test_set_dry_run(crunchy_config_dict: dict):
@@ -283,6 +288,45 @@ def test_is_compression_done_spring_old_files(
     assert "FASTQ compression is done" in caplog.text
 
 
+def test_check_if_update_spring_old_file():
+    """Test if a SPRING archive unpacked more than FASTQ delta days before today should be updated"""
+    # GIVEN a date that is more than three weeks before a given today
+    today = datetime.date(2021, 2, 1)
+    file_date = datetime.date(2021, 1, 1)
+
+    # WHEN checking if the SPRING archive should be updated
+    result = CrunchyAPI.check_if_update_spring(file_date, today=today)
+
+    # THEN result should be True since the file date is older than three weeks
+    assert result is True
+
+
+def test_check_if_update_spring_new_file():
+    """Test if a SPRING archive unpacked less than FASTQ delta days before today should be updated"""
+    # GIVEN a date that is less than three weeks before a given today
+    today = datetime.date(2021, 2, 1)
+    file_date = datetime.date(2021, 1, 25)
+
+    # WHEN checking if the SPRING archive should be updated
+    result = CrunchyAPI.check_if_update_spring(file_date, today=today)
+
+    # THEN result should be False since the file date is newer than three weeks
+    assert result is False
+
+
+def test_check_if_update_spring_datetime():
+    """Test if a SPRING archive should be updated when the unpack time is given as a datetime"""
+    # GIVEN a date and time exactly FASTQ delta days before a given today
+    today = datetime.date(2021, 2, 1)
+    file_date = datetime.datetime(2021, 1, 11, 23, 59)
+
+    # WHEN checking if the SPRING archive should be updated
+    result = CrunchyAPI.check_if_update_spring(file_date, today=today)
+
+    # THEN result should be True since only the days are compared
+    assert result is True
+
+
 def test_is_spring_decompression_possible_no_fastq(
     crunchy_config_dict: dict, compression_object: CompressionData, caplog
 ):
@@ -385,3 +429,26 @@ def test_is_pending(crunchy_config_dict: dict, compression_object: CompressionDa
 
     # THEN result should be True since the pending_path exists
     assert result is True
+
+
+def test_is_spring_decompression_possible_listed_files(
+    crunchy_config_dict: dict, compression_object: CompressionData
+):
+    """Test if decompression is possible with the files listed for several runs at once"""
+    # GIVEN a crunchy-api and a existing SPRING file without FASTQ files
+    crunchy_api = CrunchyAPI(crunchy_config_dict)
+    compression_object.spring_path.touch()
+    compression_object.fastq_first.unlink()
+    compression_object.fastq_second.unlink()
+
+    # WHEN listing the files of the run together with a run in the same directory
+    existing_file_names = crunchy_api.get_existing_file_names(
+        [compression_object, compression_object]
+    )
+
+    # THEN the same listing should be returned for both runs
+    assert existing_file_names[0] is existing_file_names[1]
+    # THEN decompression should be possible with the listed files
+    assert crunchy_api.is_spring_decompression_possible(
+        compression_object, file_names=existing_file_names[0]
+    )
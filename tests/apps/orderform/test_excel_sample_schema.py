@@ -88,6 +88,20 @@ def test_excel_with_panels(minimal_excel_sample: dict):
     assert set(excel_sample.panels) == set([panel_1, panel_2])
 
 
+def test_excel_with_colon_separated_panels(minimal_excel_sample: dict):
+    """Test instantiate a sample with gene panels in a colon separated string"""
+    # GIVEN some sample with two gene panels in a colon separated string
+    panel_1 = "OMIM"
+    panel_2 = "PID"
+    minimal_excel_sample["UDF/Gene List"] = ":".join([panel_1, panel_2])
+
+    # WHEN creating a excel sample
+    excel_sample: ExcelSample = ExcelSample(**minimal_excel_sample)
+
+    # THEN assert that the panels was parsed into a list
+    assert excel_sample.panels == [panel_1, panel_2]
+
+
 def test_mip_rna_sample_is_correct(mip_rna_orderform_sample: dict):
     """Test that a mip rna orderform sample in parsed correct
 
@@ -117,3 +131,28 @@ def test_mip_rna_sample_is_correct(mip_rna_orderform_sample: dict):
     assert mip_rna_sample.comment == "other Elution buffer"
     assert mip_rna_sample.from_sample == "s1"
     assert mip_rna_sample.time_point == "0"
+
+
+def test_excel_numeric_values(minimal_excel_sample: dict):
+    """Test instantiate a sample with numeric values given as excel floats"""
+    # GIVEN some sample with a whole number and a decimal number
+    minimal_excel_sample["UDF/Volume (uL)"] = "20.0"
+    minimal_excel_sample["UDF/Concentration (nM)"] = "10.05"
+
+    # WHEN creating a excel sample
+    excel_sample: ExcelSample = ExcelSample(**minimal_excel_sample)
+
+    # THEN assert that the trailing .0 was removed from the whole number only
+    assert excel_sample.volume == "20"
+    assert excel_sample.concentration == "10.05"
+
+
+def test_excel_non_numeric_value(minimal_excel_sample: dict):
+    """Test instantiate a sample with a volume that is not a number"""
+    # GIVEN some sample with a volume that has two decimal points
+    minimal_excel_sample["UDF/Volume (uL)"] = "1.2.3"
+
+    # WHEN creating a excel sample
+    with pytest.raises(AttributeError):
+        # THEN assert that an error is raised since the volume is not a number
+        ExcelSample(**minimal_excel_sample)
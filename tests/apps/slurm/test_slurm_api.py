@@ -28,6 +28,21 @@ def test_generate_sbatch_header(sbatch_parameters: Sbatch):
     assert f"#SBATCH --mail-user={sbatch_parameters.email}" in sbatch_header
 
 
+def test_generate_sbatch_header_array_job(sbatch_parameters: Sbatch):
+    # GIVEN a Sbatch object for a job array
+    sbatch_parameters.array_job = True
+
+    # WHEN building a sbatch header
+    sbatch_header: str = SlurmAPI.generate_sbatch_header(sbatch_parameters)
+
+    # THEN assert that each array task writes its own log files
+    log_path: str = f"{sbatch_parameters.log_dir}/{sbatch_parameters.job_name}_%A_%a"
+    assert f"#SBATCH --error={log_path}.stderr" in sbatch_header
+    assert f"#SBATCH --output={log_path}.stdout" in sbatch_header
+    # THEN assert that the job name is left as it is
+    assert f"#SBATCH --job-name={sbatch_parameters.job_name}\n" in sbatch_header
+
+
 def test_generate_sbatch_body_no_error_function(sbatch_parameters: Sbatch):
     # GIVEN a Sbatch object with some parameters
 
@@ -136,3 +151,22 @@ def test_submit_sbatch_script_invalid_sbatch_response(
 
     # THEN assert that a job number 0 indicating malfunction
     assert job_number == 0
+
+
+def test_submit_sbatch_script_array(
+    sbatch_content: str, slurm_api: SlurmAPI, sbatch_path: Path, caplog
+):
+    caplog.set_level(logging.INFO)
+    # GIVEN a slurm api
+    # GIVEN some sbatch content
+    # GIVEN the path to a sbatch file
+
+    # WHEN submitting the job as a job array
+    job_number: int = slurm_api.submit_sbatch(
+        sbatch_content=sbatch_content, sbatch_path=sbatch_path, array="0-2"
+    )
+
+    # THEN assert that a job number is returned
+    assert isinstance(job_number, int)
+    # THEN assert that the array indices were given to sbatch
+    assert f"sbatch --array 0-2 {sbatch_path}" in caplog.text
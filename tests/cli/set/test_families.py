@@ -34,3 +34,30 @@ def test_set_families_by_sample_identifiers(
     # THEN it should name the case to be changed
     assert case.internal_id in caplog.text
     assert case.name in caplog.text
+
+
+def test_set_families_commits_once(cli_runner, base_context: CGConfig, helpers, mocker):
+    # GIVEN a database with two cases with samples from the same ticket
+    base_store: Store = base_context.status_db
+    cases = []
+    for case_id in ["case_1", "case_2"]:
+        sample_obj: models.Sample = helpers.add_sample(base_store, internal_id=f"{case_id}_sample")
+        sample_obj.ticket_number = 123456
+        case: models.Family = helpers.add_case(base_store, case_id=case_id, internal_id=case_id)
+        helpers.add_relationship(base_store, sample=sample_obj, case=case)
+        cases.append(case)
+    spy_commit = mocker.spy(base_store, "commit")
+
+    # WHEN setting the priority of the cases by the ticket
+    result = cli_runner.invoke(
+        families,
+        ["--sample-identifier", "ticket_number", 123456, "--priority", "priority"],
+        obj=base_context,
+        input="y",
+    )
+
+    # THEN both cases should be updated
+    assert result.exit_code == SUCCESS
+    assert all(case.priority_human == "priority" for case in cases)
+    # THEN the changes of all cases should be committed together
+    assert spy_commit.call_count == 1
@@ -52,6 +52,23 @@ def test_set_family_bad_panel(
     assert panel_id not in base_store.Family.query.first().panels
 
 
+def test_set_family_bad_panels(
+    cli_runner: CliRunner, base_context: CGConfig, base_store: Store, helpers, caplog
+):
+    """Test to set a case using several non-existing panels"""
+    # GIVEN a database with a case
+    case_id = helpers.add_case(base_store).internal_id
+
+    # WHEN setting two panels that do not exist
+    result = cli_runner.invoke(
+        family, [case_id, "--panel", "dummy_1", "--panel", "dummy_2"], obj=base_context
+    )
+
+    # THEN then it should complain about both missing panels
+    assert result.exit_code != SUCCESS
+    assert "unknown gene panels: dummy_1, dummy_2" in caplog.text
+
+
 def test_set_family_panel(
     cli_runner: CliRunner, base_context: CGConfig, base_store: Store, helpers
 ):
@@ -1,5 +1,6 @@
 """Tests for the compression files module"""
 import logging
+from pathlib import Path
 
 import pytest
 
@@ -43,3 +44,27 @@ def test_get_fastq_files_no_files(compress_api, sample_hk_bundle_no_files, sampl
     assert fastq_dict is None
     # THEN assert that the correct information is returned
     assert f"Could not find FASTQ files for {sample}" in caplog.text
+
+
+def test_get_fastq_stub():
+    """Test to get the stub of the FASTQ files of a run"""
+    # GIVEN the path to the second read of a run
+    fastq_path = Path("/home/fastq_files/A_sequencing_run_R2_001.fastq.gz")
+
+    # WHEN fetching the stub
+    stub = files.get_fastq_stub(fastq_path)
+
+    # THEN the read suffix should be removed
+    assert stub == Path("/home/fastq_files/A_sequencing_run")
+
+
+def test_get_fastq_stub_not_fastq():
+    """Test to get the stub of a file that is not a FASTQ read"""
+    # GIVEN the path to a checksum of a FASTQ file
+    fastq_path = Path("/home/fastq_files/A_sequencing_run_R1_001.fastq.gz.md5")
+
+    # WHEN fetching the stub
+    stub = files.get_fastq_stub(fastq_path)
+
+    # THEN no stub should be returned
+    assert stub is None
@@ -1,6 +1,9 @@
 """Tests for FASTQ part of meta compress api"""
 import logging
 
+from cg.meta.compress import files
+from cg.models import CompressionData
+
 
 def test_compress_case_fastq_one_sample(populated_compress_fastq_api, sample, caplog):
     """Test to compress all FASTQ files for a sample"""
@@ -61,3 +64,32 @@ def test_compress_case_fastq_compression_pending(
     assert res is False
     # THEN assert that the correct information is communicated
     assert f"FASTQ to SPRING not possible for {sample}" in caplog.text
+
+
+def test_compress_fastq_several_runs(compress_api, sample, tmp_path, mocker):
+    """Test to compress the FASTQ files of a sample with several runs
+
+    The runs should be compressed with one job array
+    """
+    # GIVEN a compress api and a sample with FASTQ files from two runs
+    sample_fastq_dict = {}
+    for run_name in ["run_1", "run_2"]:
+        compression_object = CompressionData(tmp_path / run_name)
+        for fastq_path in [compression_object.fastq_first, compression_object.fastq_second]:
+            fastq_path.write_text("@read")
+        sample_fastq_dict[run_name] = {"compression_data": compression_object}
+    mocker.patch.object(files, "get_fastq_files", return_value=sample_fastq_dict)
+    mocker.patch.object(compress_api, "get_latest_version")
+    mocker.patch.object(compress_api.crunchy_api, "fastq_to_spring")
+    mocker.patch.object(compress_api.crunchy_api, "fastq_to_spring_batch")
+
+    # WHEN compressing the FASTQ files of the sample
+    res = compress_api.compress_fastq(sample)
+
+    # THEN assert compression succeded
+    assert res is True
+    # THEN assert that both runs were submitted in one job array
+    compress_api.crunchy_api.fastq_to_spring.assert_not_called()
+    compress_api.crunchy_api.fastq_to_spring_batch.assert_called_once_with(
+        [run["compression_data"] for run in sample_fastq_dict.values()], sample_id=sample
+    )
@@ -26,3 +26,27 @@ def test_decompress_spring(populated_decompress_spring_api, compression_files, s
     assert res is True
     # THEN assert that the correct information is communicated
     assert f"Decompressing {spring_path} to FASTQ format for sample {sample}" in caplog.text
+
+
+def test_decompress_spring_dry_run(
+    populated_decompress_spring_api, compression_files, sample, caplog
+):
+    """Test that a dry run decompression does not update the SPRING metadata file"""
+    caplog.set_level(logging.DEBUG)
+    compress_api = populated_decompress_spring_api
+    compress_api.set_dry_run(True)
+    # GIVEN a SPRING archive with a metadata file and no FASTQ files
+    compression_files.spring_file
+    spring_metadata_path = compression_files.spring_metadata_file
+    metadata_content = spring_metadata_path.read_text()
+    compression_files.fastq_first.unlink()
+    compression_files.fastq_second.unlink()
+
+    # WHEN decompressing the SPRING file for the sample in dry run mode
+    res = compress_api.decompress_spring(sample)
+
+    # THEN assert decompression succeded
+    assert res is True
+    # THEN assert that the metadata file was left untouched
+    assert spring_metadata_path.read_text() == metadata_content
+    assert f"Would update date in {spring_metadata_path}" in caplog.text
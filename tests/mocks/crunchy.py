@@ -1,7 +1,9 @@
 """Mock the crunchy API"""
 
+import datetime
 import logging
 from pathlib import Path
+from typing import List, Optional
 
 from cg.apps.crunchy.crunchy import CrunchyAPI
 from cg.models import CompressionData
@@ -64,6 +66,11 @@ class MockCrunchyAPI(CrunchyAPI):
         self._nr_fastq_compressions += 1
         self.set_compression_pending_all()
 
+    def fastq_to_spring_batch(self, compression_objs: List[CompressionData], sample_id: str):
+        """Mock method that compress the FASTQ files of several runs with one job array"""
+        self._nr_fastq_compressions += len(compression_objs)
+        self.set_compression_pending_all()
+
     def spring_to_fastq(self, compression_obj: CompressionData, sample_id: str = ""):
         """Mock method that compress spring to fastq"""
         self._nr_fastq_compressions += 1
@@ -92,7 +99,9 @@ class MockCrunchyAPI(CrunchyAPI):
         print(f"Compression possible {compression_possible}")
         return compression_possible
 
-    def is_fastq_compression_done(self, compression_obj: CompressionData) -> bool:
+    def is_fastq_compression_done(
+        self, compression_obj: CompressionData, today: Optional[datetime.date] = None
+    ) -> bool:
         """Check if spring compression if finished"""
         return self._compression_done_all
 
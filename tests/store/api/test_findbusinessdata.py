@@ -12,3 +12,19 @@ def test_find_analysis_via_date(sample_store, helpers):
 
     # THEN the analysis should have been retrieved
     assert db_analysis == analysis
+
+
+def test_family_with_links(base_store, helpers):
+    # GIVEN a case with a linked sample in the database
+    case_obj = helpers.add_case(base_store)
+    sample_obj = helpers.add_sample(base_store)
+    helpers.add_relationship(base_store, sample=sample_obj, case=case_obj)
+    case_id, sample_id = case_obj.internal_id, sample_obj.internal_id
+    base_store.session.expunge_all()
+
+    # WHEN fetching the case together with its links
+    db_case = base_store.family_with_links(case_id)
+
+    # THEN the linked sample should already be loaded with the case
+    assert "links" in db_case.__dict__
+    assert [link.sample.internal_id for link in db_case.links] == [sample_id]
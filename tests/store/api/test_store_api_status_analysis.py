@@ -22,6 +22,19 @@ def test_that_many_cases_can_have_one_sample_each(base_store: Store, helpers):
     assert len(cases) == len(test_cases)
 
 
+def test_cases_to_analyze_limit(base_store: Store, helpers):
+    """Test that no more cases than the limit are returned among the cases to analyse"""
+
+    # GIVEN a database with five cases with sequenced samples
+    add_cases_with_samples(base_store, helpers, 5, sequenced_at=datetime.now())
+
+    # WHEN getting at most two cases to analyse
+    cases = base_store.cases_to_analyze(pipeline=Pipeline.MIP_DNA, limit=2)
+
+    # THEN only two cases should be returned
+    assert len(cases) == 2
+
+
 def test_that_cases_can_have_many_samples(base_store: Store, helpers):
     """Test that tests that cases are returned even if there are many result rows in the query"""
 
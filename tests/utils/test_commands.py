@@ -51,6 +51,15 @@ def test_process_run_command_with_params(ls_process):
     assert i > 1
 
 
+def test_process_run_command_with_tuple_params(ls_process):
+    # GIVEN a process with 'ls' as binary
+    process = ls_process
+    # WHEN running the command with the parameters in a tuple
+    process.run_command(parameters=("-a",))
+    # THEN assert the parameters were passed on to the command
+    assert "." in process.stdout.split("\n")
+
+
 def test_process_std_err(ls_process):
     # GIVEN a proces with 'ls' as binary
     process = ls_process
@@ -0,0 +1,45 @@
+"""Tests for the file helpers"""
+from pathlib import Path
+
+from cg.utils import files
+
+
+def test_get_dir_entry_names(tmp_path: Path):
+    """Test to list the names of the files in a directory"""
+    # GIVEN a directory with a file
+    file_path: Path = tmp_path / "a_file.txt"
+    file_path.touch()
+
+    # WHEN listing the names of the files in the directory
+    file_names: set = files.get_dir_entry_names(tmp_path)
+
+    # THEN assert that the name of the file is returned
+    assert file_names == {file_path.name}
+
+
+def test_get_dir_entry_names_missing_dir(tmp_path: Path):
+    """Test to list the names of the files in a directory that does not exist"""
+    # GIVEN a directory that does not exist
+    directory: Path = tmp_path / "missing"
+
+    # WHEN listing the names of the files in the directory
+    file_names: set = files.get_dir_entry_names(directory)
+
+    # THEN assert that no names are returned
+    assert file_names == set()
+
+
+def test_get_dir_entries(tmp_path: Path):
+    """Test to list the entries of a directory with a file and a sub directory"""
+    # GIVEN a directory with a file and a sub directory
+    (tmp_path / "a_file.txt").touch()
+    (tmp_path / "a_dir").mkdir()
+
+    # WHEN listing the entries of the directory
+    entries = files.get_dir_entries(tmp_path)
+
+    # THEN assert that the entries tell which one is a directory
+    assert {entry.name: entry.is_dir() for entry in entries} == {
+        "a_file.txt": False,
+        "a_dir": True,
+    }